@@ -1,5 +1,29 @@
 """Agent package entrypoint."""
 
-from almasp.main import main
+import importlib
+import sys
+import types
 
 __all__ = ["main"]
+
+
+class _Package(types.ModuleType):
+    def __setattr__(self, name: str, value: object) -> None:
+        # Importing the almasp.main submodule binds it on the package; keep the
+        # function there instead so `from almasp import main` is order independent
+        if name == "main" and isinstance(value, types.ModuleType):
+            value = value.main
+        super().__setattr__(name, value)
+
+
+def __getattr__(name: str):
+    # Import the agent stack only when main is requested, so light entry
+    # points such as download-lpcp start without it
+    if name == "main":
+        main = getattr(importlib.import_module(".main", __name__), "main")
+        globals()["main"] = main
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+sys.modules[__name__].__class__ = _Package
@@ -2,76 +2,81 @@
 
 import asyncio
 import os
+import re
 from pathlib import Path
-from typing import Iterable
-
-from dotenv import load_dotenv
 
 from almasp.cli import build_batch_cli_parser, validate_cli_args
-from almasp.config import ASPSystemConfig
-from almasp.runner import BatchRunner
-from almasp.utils import export_solution, reset_logger, setup_logger
+from almasp.config import ASPSystemConfig, load_env
+from almasp.utils import current_problem, export_solution, reset_logger, setup_logger
 
-load_dotenv()
+load_env()
 
 
-def find_problem_files(root: Path, years: list[str] | None = None) -> list[Path]:
+def find_problem_files(
+    root: Path, years: list[str] | None = None, pattern: str | None = None
+) -> list[Path]:
     """Find all problem files in LPCP directory structure.
 
     Args:
         root: Root directory containing lpcp-YYYY folders
         years: Optional list of years to filter (e.g., ["2022", "2023"])
+        pattern: Optional regular expression searched in each file name
 
     Returns:
         List of problem file paths found
     """
-    base = root
-
-    # Determine which year directories to search
-    if years:
-        candidates: Iterable[Path] = [base / f"lpcp-{y}" for y in years]
+    # Without a year filter, a single glob walks every lpcp-* folder at once
+    if not years:
+        problem_files = sorted(root.glob("lpcp-*/problem-*.md"))
     else:
-        candidates = [
-            p for p in base.iterdir() if p.is_dir() and p.name.startswith("lpcp-")
-        ]
-
-    problem_files: list[Path] = []
+        problem_files = []
+        for year in years:
+            # Find all problem-*.md files in this year (empty if the folder is missing)
+            problem_files.extend(sorted((root / f"lpcp-{year}").glob("problem-*.md")))
 
-    for year_dir in candidates:
-        if not year_dir.exists() or not year_dir.is_dir():
-            continue
-
-        # Find all problem-*.md files in this year
-        for f in sorted(year_dir.glob("problem-*.md")):
-            problem_files.append(f)
+    if pattern:
+        search = re.compile(pattern).search
+        problem_files = [f for f in problem_files if search(f.name)]
 
     return problem_files
 
 
 async def run_for_file(
     problem_file: Path, config: ASPSystemConfig, export_path: Path
-) -> None:
+) -> bool:
     """Run solver for a single file and export results.
 
+    Safe to run concurrently: log records emitted by this task only reach
+    the handlers created for this problem file.
+
     Args:
         problem_file: Path to problem file
         config: System configuration
         export_path: Path to export results
+
+    Returns:
+        True if the problem was solved, False if it failed or raised
     """
+    # Route this task's log records to this file's handlers
+    current_problem.set(problem_file)
+
     # Setup logger for this specific file
     logger = setup_logger(
         problem_file, os.getenv("LOG_LEVEL", "INFO").upper(), export_path=export_path
     )
 
     try:
+        # Deferred so --help and argument errors skip the agent stack import
+        from almasp.runner import BatchRunner
+
         # Create runner and solve
         runner = BatchRunner(config, logger)
         result = await runner.runner.solve(problem_file)
 
         # Export result
         if result:
-            output_files = export_solution(
-                problem_file, result.to_dict(), export_path=export_path
+            output_files = await asyncio.to_thread(
+                export_solution, problem_file, result.to_dict(), export_path=export_path
             )
             logger.info(f"Results saved to: {output_files['json']}")
             if "lp" in output_files:
@@ -90,15 +95,18 @@ async def run_for_file(
                 logger.info(f"Solved in {result.iterations} iterations")
             else:
                 logger.warning(f"Failed: {result.error_code}")
-        else:
-            logger.error(f"No result returned for {problem_file}")
+            return result.success
+
+        logger.error(f"No result returned for {problem_file}")
+        return False
 
     except Exception as e:
-        logger.error(f"Error processing {problem_file}: {e}")
+        logger.exception(f"Error processing {problem_file}: {e}")
+        return False
 
     finally:
-        # Clean up logger handlers
-        reset_logger()
+        # Clean up this file's logger handlers
+        reset_logger(problem_file)
 
 
 async def main() -> None:
@@ -124,6 +132,7 @@ async def main() -> None:
         validator_prompt_file=args.validator_prompt,
         provider=args.provider,
         reasoning=args.reasoning,
+        execution_cache=False if args.no_cache else None,
     )
 
     # Parse years filter
@@ -132,33 +141,49 @@ async def main() -> None:
         years = [y.strip() for y in args.years.split(",") if y.strip()]
 
     # Find problem files
-    problem_files = find_problem_files(args.root, years)
+    problem_files = find_problem_files(args.root, years, args.problem_filter)
 
     if not problem_files:
         print("No problem files found.")
         print(f"Searched in: {args.root}")
         if years:
             print(f"Filtered for years: {', '.join(years)}")
+        if args.problem_filter:
+            print(f"Filtered by pattern: {args.problem_filter}")
         return
 
     print(f"Found {len(problem_files)} problem files")
     print(
-        f"Configuration: model={config.model_name}, max_iterations={config.max_iterations}"
+        f"Configuration: model={config.model_name}, max_iterations={config.max_iterations}, "
+        f"concurrency={args.concurrency}"
     )
     print("-" * 60)
 
-    # Process each file
-    successful = 0
-    failed = 0
+    # Process files concurrently, at most args.concurrency at a time
+    semaphore = asyncio.Semaphore(args.concurrency)
+    started = 0
 
-    for i, problem_file in enumerate(problem_files, 1):
-        print(f"\n[{i}/{len(problem_files)}] Processing: {problem_file}")
+    async def run_bounded(problem_file: Path) -> bool:
+        nonlocal started
+        async with semaphore:
+            started += 1
+            print(f"\n[{started}/{len(problem_files)}] Processing: {problem_file}")
+            return await run_for_file(problem_file, config, export_path)
+
+    results = await asyncio.gather(
+        *(run_bounded(problem_file) for problem_file in problem_files),
+        return_exceptions=True,
+    )
 
-        try:
-            await run_for_file(problem_file, config, export_path)
+    successful = 0
+    failed = 0
+    for problem_file, outcome in zip(problem_files, results):
+        if isinstance(outcome, BaseException):
+            print(f"Error processing {problem_file}: {outcome}")
+            failed += 1
+        elif outcome:
             successful += 1
-        except Exception as e:
-            print(f"Error: {e}")
+        else:
             failed += 1
 
     # Print summary
@@ -0,0 +1,86 @@
+"""Persistent execution cache for Agentic ASP solver runs.
+
+Stores successful solution results in a SQLite database keyed by a hash of
+the problem description, system prompts, and model, so repeated runs of the
+same problem can be replayed without invoking the agents.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+
+DEFAULT_CACHE_PATH = Path(".almasp_cache.sqlite")
+
+
+def make_cache_key(*parts: str) -> str:
+    """Build a stable cache key from the given input parts.
+
+    Parts are whitespace-normalized at the edges and hashed with BLAKE2b,
+    so any change to a prompt or model invalidates previous entries.
+
+    Args:
+        *parts: Input strings identifying a run (problem, prompts, model, ...)
+
+    Returns:
+        Hex digest identifying the run
+    """
+    digest = hashlib.blake2b(digest_size=32)
+    for part in parts:
+        digest.update(part.strip().encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class ExecutionCache:
+    """SQLite-backed store of exported solution results."""
+
+    def __init__(self, path: Path | None = None):
+        """Initialize the cache and create its table if needed.
+
+        Args:
+            path: Database file path (default: ALMASP_EXEC_CACHE_PATH env
+                variable or .almasp_cache.sqlite)
+        """
+        self.path = path or Path(
+            os.getenv("ALMASP_EXEC_CACHE_PATH", str(DEFAULT_CACHE_PATH))
+        )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS executions "
+                "(key TEXT PRIMARY KEY, result TEXT NOT NULL)"
+            )
+
+    def _connect(self) -> closing[sqlite3.Connection]:
+        return closing(sqlite3.connect(self.path))
+
+    def get(self, key: str) -> dict | None:
+        """Return the stored result for a key.
+
+        Args:
+            key: Cache key from make_cache_key
+
+        Returns:
+            Result dictionary, or None on a cache miss
+        """
+        with self._connect() as conn, conn:
+            row = conn.execute(
+                "SELECT result FROM executions WHERE key = ?", (key,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, key: str, result: dict) -> None:
+        """Store a result dictionary under a key.
+
+        Args:
+            key: Cache key from make_cache_key
+            result: JSON-serializable result dictionary
+        """
+        with self._connect() as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO executions (key, result) VALUES (?, ?)",
+                (key, json.dumps(result)),
+            )
@@ -1,6 +1,8 @@
 """CLI argument parsing for ASP solver."""
 
 import argparse
+import os
+import re
 from pathlib import Path
 
 
@@ -104,6 +106,9 @@ Examples:
   almasp-batch
   almasp-batch --years 2022,2023
   almasp-batch --root my_problems/ --model gpt-oss:20b
+  almasp-batch --concurrency 2
+  almasp-batch --problem-filter 'problem-[12]'
+  almasp-batch --no-cache
         """,
     )
 
@@ -121,6 +126,20 @@ Examples:
         help="Comma-separated years to include (e.g., 2022,2023). Empty = all",
     )
 
+    parser.add_argument(
+        "--problem-filter",
+        type=str,
+        default=None,
+        help="Regular expression matched against problem file names (e.g., 'problem-[12]\\.md')",
+    )
+
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=os.getenv("MAX_CONCURRENCY", "1"),
+        help="Number of problems solved concurrently (default: MAX_CONCURRENCY env or 1)",
+    )
+
     parser.add_argument(
         "--solver-prompt",
         type=Path,
@@ -164,6 +183,12 @@ Examples:
         help="Reasoning level for reasoning models: 'low', 'medium', 'high', 'true', or 'false' (default: from env or 'low')",
     )
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore the execution cache even if ALMASP_EXEC_CACHE is enabled",
+    )
+
     parser.add_argument(
         "--log-level",
         type=str,
@@ -202,6 +227,17 @@ def validate_cli_args(args: argparse.Namespace) -> str | None:
     if args.validator_prompt and not args.validator_prompt.exists():
         return f"Validator prompt file not found: {args.validator_prompt}"
 
+    # Validate problem filter pattern
+    if getattr(args, "problem_filter", None):
+        try:
+            re.compile(args.problem_filter)
+        except re.error as e:
+            return f"Invalid problem filter pattern: {e}"
+
+    # Validate batch concurrency
+    if hasattr(args, "concurrency") and args.concurrency < 1:
+        return "Concurrency must be at least 1"
+
     # Validate max iterations
     if hasattr(args, "max_iterations") and args.max_iterations is not None:
         if args.max_iterations < 1:
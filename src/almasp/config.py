@@ -5,9 +5,55 @@ validation, and access to model, prompt, and MCP solver settings.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
-from pydantic import BaseModel, Field, field_validator
+from dotenv import load_dotenv
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+# Accepted reasoning strings (lowercase) and their normalized values
+_REASONING_LEVELS: dict[str, str | bool] = {
+    "true": True,
+    "false": False,
+    "low": "low",
+    "medium": "medium",
+    "high": "high",
+}
+
+
+@lru_cache(maxsize=1)
+def load_env() -> None:
+    """Load the .env file into the environment once per process.
+
+    Entry points call this at import; later calls are no-ops, so the file
+    is parsed once even when several entry modules are imported.
+    """
+    load_dotenv()
+
+
+def _env_flag(name: str) -> bool:
+    """Read a boolean switch from the environment.
+
+    Args:
+        name: Environment variable name
+
+    Returns:
+        True if the variable is set to '1', 'true', or 'yes'
+    """
+    return os.getenv(name, "").strip().lower() in ("1", "true", "yes")
+
+
+@lru_cache(maxsize=16)
+def _split_args(raw: str) -> tuple[str, ...]:
+    """Split a comma-separated argument string, dropping empty entries.
+
+    Args:
+        raw: Comma-separated arguments (e.g., MCP_SOLVER_ARGS)
+
+    Returns:
+        Tuple of stripped argument strings
+    """
+    return tuple(arg.strip() for arg in raw.split(",") if arg.strip())
 
 
 class MCPServerConfig(BaseModel):
@@ -15,27 +61,29 @@ class MCPServerConfig(BaseModel):
 
     Attributes:
         command: Executable command (e.g., 'uv')
-        args: List of arguments (e.g., ['--directory', '/path', 'run', 'mcp-solver-asp'])
+        args: Tuple of arguments (e.g., ('--directory', '/path', 'run', 'mcp-solver-asp'))
         transport: Communication protocol (default: 'stdio')
     """
 
+    model_config = ConfigDict(frozen=True)
+
     command: str
-    args: list[str] = Field(default_factory=list)
+    args: tuple[str, ...] = ()
     transport: str = "stdio"
 
     @field_validator("args", mode="before")
     @classmethod
     def parse_args(cls, v):
-        """Parse args from comma-separated string or list.
+        """Parse args from comma-separated string or sequence.
 
         Args:
-            v: String or list of arguments
+            v: String or sequence of arguments
 
         Returns:
-            List of argument strings
+            Tuple of argument strings
         """
         if isinstance(v, str):
-            return [arg.strip() for arg in v.split(",") if arg.strip()]
+            return _split_args(v)
         return v
 
 
@@ -51,10 +99,22 @@ class ASPSystemConfig(BaseModel):
         reasoning: Reasoning level for reasoning models ('low', 'medium', 'high', or bool)
         solver_prompt_file: Optional custom solver prompt file path
         validator_prompt_file: Optional custom validator prompt file path
+        solver_prompt_content: Optional custom solver prompt text (takes precedence over file)
+        validator_prompt_content: Optional custom validator prompt text (takes precedence over file)
         mcp_servers: Dictionary of MCP server configurations by name
         max_iterations: Maximum solver-validator loop iterations (default: 5)
+        solver_history_max_messages: Prior solver messages replayed with feedback
+            (default: 20, 0 replays the full history)
+        mcp_max_inflight: Concurrent tool calls per MCP session (default: 4, minimum 1)
+        execution_cache: Replay stored results of identical runs (default: False)
+        llm_cache: Answer repeated identical LLM prompts from memory (default: False)
+
+    Instances are frozen: one config is shared by every concurrent batch task,
+    so no task can change settings under another.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     # LLM configuration
     provider: str = "ollama"  # 'openrouter' or 'ollama'
     model_name: str = "gpt-oss:20b"
@@ -66,12 +126,18 @@ class ASPSystemConfig(BaseModel):
     # Prompts
     solver_prompt_file: Path | None = None
     validator_prompt_file: Path | None = None
+    solver_prompt_content: str | None = None
+    validator_prompt_content: str | None = None
 
     # MCP Server configuration
     mcp_servers: dict[str, MCPServerConfig] = Field(default_factory=dict)
 
     # System behavior
     max_iterations: int = 5
+    solver_history_max_messages: int = Field(default=20, ge=0)
+    mcp_max_inflight: int = Field(default=4, ge=1)
+    execution_cache: bool = False
+    llm_cache: bool = False
 
     @field_validator("provider")
     @classmethod
@@ -105,26 +171,24 @@ class ASPSystemConfig(BaseModel):
         Raises:
             ValueError: If reasoning is invalid
         """
+        # Runs after pydantic's str | bool validation, so v is a str or bool
         if isinstance(v, bool):
             return v
-        if isinstance(v, str):
-            lower_v = v.lower()
-            if lower_v == "true":
-                return True
-            if lower_v == "false":
-                return False
-            if v.lower() in ["low", "medium", "high"]:
-                return v.lower()
+        level = _REASONING_LEVELS.get(v.lower())
+        if level is None:
             raise ValueError(
                 "reasoning must be a boolean, 'low', 'medium', 'high', 'true', or 'false'"
             )
+        return level
 
     @classmethod
     def from_env(cls, **overrides) -> "ASPSystemConfig":
         """Load configuration from environment variables with optional overrides.
 
         Reads MCP_SOLVER_COMMAND, MCP_SOLVER_ARGS (required), MODEL_NAME,
-        PROVIDER_BASE_URL, PROVIDER_API_KEY, TEMPERATURE, and MAX_ITERATIONS.
+        PROVIDER_BASE_URL, PROVIDER_API_KEY, TEMPERATURE, MAX_ITERATIONS,
+        SOLVER_HISTORY_MAX_MESSAGES, MCP_MAX_INFLIGHT, ALMASP_EXEC_CACHE, and
+        ALMASP_LLM_CACHE.
 
         Args:
             **overrides: Configuration values to override from environment
@@ -151,7 +215,7 @@ class ASPSystemConfig(BaseModel):
 
         # Parse MCP args from environment
         mcp_args_env = os.getenv("MCP_SOLVER_ARGS", "")
-        mcp_args = [arg.strip() for arg in mcp_args_env.split(",") if arg.strip()]
+        mcp_args = _split_args(mcp_args_env)
 
         if not mcp_args:
             raise ValueError(
@@ -168,6 +232,12 @@ class ASPSystemConfig(BaseModel):
             "api_key": os.getenv("PROVIDER_API_KEY", "ollama"),
             "reasoning": os.getenv("REASONING_LEVEL", False),
             "max_iterations": int(os.getenv("MAX_ITERATIONS", "5")),
+            "solver_history_max_messages": os.getenv(
+                "SOLVER_HISTORY_MAX_MESSAGES", "20"
+            ),
+            "mcp_max_inflight": os.getenv("MCP_MAX_INFLIGHT", "4"),
+            "execution_cache": _env_flag("ALMASP_EXEC_CACHE"),
+            "llm_cache": _env_flag("ALMASP_LLM_CACHE"),
             "mcp_servers": {
                 "mcp-solver": MCPServerConfig(
                     command=os.getenv("MCP_SOLVER_COMMAND", "uv"),
@@ -178,8 +248,9 @@ class ASPSystemConfig(BaseModel):
         }
 
         # Apply overrides (filter out None values)
-        filtered_overrides = {k: v for k, v in overrides.items() if v is not None}
-        config_dict.update(filtered_overrides)
+        for key, value in overrides.items():
+            if value is not None:
+                config_dict[key] = value
 
         return cls(**config_dict)
 
@@ -195,6 +266,7 @@ class ASPSystemConfig(BaseModel):
         Raises:
             KeyError: If server name not found in mcp_servers
         """
-        if name not in self.mcp_servers.keys():
+        server = self.mcp_servers.get(name)
+        if server is None:
             raise KeyError(f"MCP server '{name}' not found in configuration")
-        return self.mcp_servers[name]
+        return server
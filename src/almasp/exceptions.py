@@ -122,6 +122,17 @@ class TimeoutError(ASPException):
         super().__init__("TIMEOUT", message)
 
 
+# Lowercase keywords identifying each error category in exception messages
+_CONNECTION_KEYWORDS = (
+    "connection reset",
+    "connection refused",
+    "network error",
+    "connection error",
+)
+_AUTH_KEYWORDS = ("unauthorized", "invalid api key", "401", "403")
+_FILE_KEYWORDS = ("file not found", "no such file", "cannot open")
+
+
 def classify_exception(error: Exception) -> ASPException:
     """Classify a generic exception into an ASPException.
 
@@ -135,70 +146,64 @@ def classify_exception(error: Exception) -> ASPException:
         return error
     
     # Get the root cause for better classification
-    root_message = _root_cause_message(error).lower()
-
-    full_context = f"{str(error)} {root_message}".lower()
+    message = str(error)
+    root_message = _root_cause_message(error)
+    full_context = f"{message} {root_message}".lower()
 
     # Check for connection errors
-    if any(
-        keyword in full_context
-        for keyword in ["connection reset", "connection refused", "network error", "connection error"]
-    ):
-        return ConnectionError(str(error))
+    if any(keyword in full_context for keyword in _CONNECTION_KEYWORDS):
+        return ConnectionError(message)
 
     # Check for authentication errors
-    if any(
-        keyword in full_context
-        for keyword in ["unauthorized", "invalid api key", "401", "403"]
-    ):
-        return AuthError(str(error))
+    if any(keyword in full_context for keyword in _AUTH_KEYWORDS):
+        return AuthError(message)
 
     # Check for model not found errors
     if ("404" in full_context or "not found" in full_context) and "model" in full_context:
-        return ModelNotFoundError(str(error))
+        return ModelNotFoundError(message)
 
     # Check for file errors
-    if any(
-        keyword in full_context
-        for keyword in ["file not found", "no such file", "cannot open"]
-    ):
-        return FileError(str(error))
+    if any(keyword in full_context for keyword in _FILE_KEYWORDS):
+        return FileError(message)
 
     # Check for MCP errors
     if "mcp" in full_context or "server" in full_context:
-        return MCPError(str(error))
+        return MCPError(message)
 
     # Default to generic ASPException
-    return ASPException("UNKNOWN", str(error))
+    return ASPException("UNKNOWN", message)
 
 
 def _root_cause_message(error: BaseException) -> str:
     """Extract a concise root-cause message from nested exceptions.
 
+    Follows the first exception of exception groups, then explicit causes,
+    then implicit contexts. Iterative, so deep chains cannot hit the
+    recursion limit and cyclic chains terminate.
+
     Args:
         error: The exception to analyze
 
     Returns:
         String representation of the root cause
     """
-    try:
+    current = error
+    seen: set[int] = set()
+    while id(current) not in seen:
+        seen.add(id(current))
+
         # ExceptionGroup handling
-        exceptions_attr = getattr(error, "exceptions", None)
-        if exceptions_attr and isinstance(exceptions_attr, (list, tuple)) and exceptions_attr:
+        exceptions_attr = getattr(current, "exceptions", None)
+        if isinstance(exceptions_attr, (list, tuple)) and exceptions_attr:
             first = exceptions_attr[0]
             if isinstance(first, BaseException):
-                return _root_cause_message(first)
-
-        # Prefer explicit cause
-        cause: BaseException | None = getattr(error, "__cause__", None)
-        if cause is not None:
-            return _root_cause_message(cause)
+                current = first
+                continue
 
-        # Fallback to context if present
-        context: BaseException | None = getattr(error, "__context__", None)
-        if context is not None:
-            return _root_cause_message(context)
+        # Prefer explicit cause, fall back to context if present
+        next_error = current.__cause__ or current.__context__
+        if next_error is None:
+            break
+        current = next_error
 
-        return str(error)
-    except Exception:
-        return str(error)
+    return str(current)
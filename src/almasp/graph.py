@@ -1,7 +1,10 @@
 """LangGraph workflow definition for Agentic ASP solver."""
 
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from langchain_core.tools import BaseTool
-from langgraph.checkpoint.memory import InMemorySaver
 from langgraph.graph import END, START, StateGraph
 from langgraph.graph.state import CompiledStateGraph
 from langchain.agents import create_agent
@@ -12,17 +15,45 @@ from langchain_core.messages import ToolMessage
 
 from almasp.config import ASPSystemConfig
 from almasp.llm import build_llm
-from almasp.mcp_client import MCPClientManager
+from almasp.mcp_client import MCPClientManager, load_session_tools
 from almasp.prompts import PromptManager
 from almasp.state import ASPState
-from almasp.workflow import should_continue, solver_node, validator_node
+from almasp.workflow import (
+    should_continue,
+    solver_node,
+    validator_node,
+)
+
+# Default system prompts, snapshotted once at import
+_DEFAULT_SOLVER_PROMPT = PromptManager.SOLVER.default_content
+_DEFAULT_VALIDATOR_PROMPT = PromptManager.VALIDATOR.default_content
+
+# MCP tools available to the validator agent
+VALIDATOR_TOOL_NAMES = ("get_model", "solve_model")
+
 
 class AsyncMiddleware(AgentMiddleware):
     """Async middleware wrapper for tool calls."""
+
+    def __init__(self, semaphore: asyncio.Semaphore | None = None):
+        """Initialize the middleware.
+
+        Args:
+            semaphore: Optional semaphore bounding in-flight tool calls
+        """
+        super().__init__()
+        self.semaphore = semaphore
+
     async def awrap_tool_call(self, request, handler):
         """Handle tool execution errors with custom messages."""
         try:
-            return await handler(request)
+            if self.semaphore is None:
+                return await handler(request)
+            async with self.semaphore:
+                return await handler(request)
+        except asyncio.CancelledError:
+            # Never turn a cancelled run (e.g. the webapp Stop button) into a tool error
+            raise
         except Exception as e:
             # Return a custom error message to the model
             return ToolMessage(
@@ -36,6 +67,7 @@ async def create_asp_system(
     tools: list[BaseTool],
     solver_prompt: str | None = None,
     validator_prompt: str | None = None,
+    max_inflight: int = 4,
 ) -> CompiledStateGraph:
     """Create and compile the ASP multi-agent system graph.
 
@@ -44,38 +76,49 @@ async def create_asp_system(
         tools: List of MCP tools to use
         solver_prompt: Optional custom solver prompt (uses default if None)
         validator_prompt: Optional custom validator prompt (uses default if None)
+        max_inflight: Maximum concurrent tool calls on the shared MCP session
 
     Returns:
         Compiled LangGraph application
     """
 
     # Use provided prompts or fall back to defaults
-    final_solver_prompt = solver_prompt or PromptManager.SOLVER.default_content
-    final_validator_prompt = validator_prompt or PromptManager.VALIDATOR.default_content
+    final_solver_prompt = solver_prompt or _DEFAULT_SOLVER_PROMPT
+    final_validator_prompt = validator_prompt or _DEFAULT_VALIDATOR_PROMPT
+
+    # Both agents call tools on the same MCP session, so they share one
+    # bound on in-flight calls to avoid flooding the server
+    tool_semaphore = asyncio.Semaphore(max_inflight)
 
-    # Create ReAct agents
+    # Create ReAct agents. create_agent only assembles the agent graph in
+    # memory (no I/O), so both agents are built inline rather than in threads.
     solver_agent = create_agent(
         llm,
         tools=tools,
-        middleware=[AsyncMiddleware()],
+        middleware=[AsyncMiddleware(tool_semaphore)],
         system_prompt=final_solver_prompt,
     )
 
-    # Validator only needs solve_model and add_item tools
+    # Validator only needs get_model and solve_model tools
+    tool_by_name = {tool.name: tool for tool in tools}
     validator_tools = [
-        tool for tool in tools if tool.name in ["get_model", "solve_model"]
+        tool_by_name[name] for name in VALIDATOR_TOOL_NAMES if name in tool_by_name
     ]
 
+    # Every loaded tool the validator does not get can change the model, so
+    # renamed or new server tools still count as edits
+    edit_tool_names = frozenset(tool_by_name) - set(VALIDATOR_TOOL_NAMES)
+
     validator_agent = create_agent(
         llm,
         tools=validator_tools,
-        middleware=[AsyncMiddleware()],
+        middleware=[AsyncMiddleware(tool_semaphore)],
         system_prompt=final_validator_prompt,
     )
 
     # Create wrapper functions for nodes
     async def solver_node_wrapper(state):
-        return await solver_node(state, solver_agent)
+        return await solver_node(state, solver_agent, edit_tool_names)
 
     async def validator_node_wrapper(state):
         return await validator_node(state, validator_agent)
@@ -94,23 +137,29 @@ async def create_asp_system(
         "validator", should_continue, {"solver": "solver", "end": END}
     )
 
-    # Compile with checkpointing
-    memory = InMemorySaver()
-    app = workflow.compile(checkpointer=memory)
+    # Compile without a checkpointer: every solve starts a fresh thread and
+    # nothing reads past checkpoints, so snapshotting the growing message
+    # history after each step would be pure overhead. The LangGraph server
+    # attaches its own persistence to graphs it serves.
+    return workflow.compile()
 
-    return app
 
-
-async def _create_agents_graph(config: RunnableConfig):
+@asynccontextmanager
+async def _create_agents_graph(
+    config: RunnableConfig,
+) -> AsyncIterator[CompiledStateGraph]:
     """Graph factory for LangGraph Studio/Dev.
 
     This function is called by LangGraph Studio and must accept
-    exactly one RunnableConfig parameter.
+    exactly one RunnableConfig parameter. Each build gets its own MCP
+    session, which stays open while the graph runs and closes afterwards,
+    so concurrent runs never share a solver model and a dead solver
+    process only affects the run that used it.
 
     Args:
         config: Runtime configuration from LangGraph
 
-    Returns:
+    Yields:
         Compiled graph ready for execution
     """
     # Extract configurable values
@@ -130,13 +179,14 @@ async def _create_agents_graph(config: RunnableConfig):
     mcp_manager = MCPClientManager(system_config)
 
     async with mcp_manager.get_session("mcp-solver") as session:
-        from langchain_mcp_adapters.tools import load_mcp_tools
-
-        tools = await load_mcp_tools(session)
+        tools = await load_session_tools(
+            session, system_config.get_mcp_server("mcp-solver")
+        )
 
         # Build LLM
         llm = build_llm(system_config)
 
-        # Create and return the graph
-        app = await create_asp_system(llm, tools)
-        return app
+        # Create the graph and keep the session open while it runs
+        yield await create_asp_system(
+            llm, tools, max_inflight=system_config.mcp_max_inflight
+        )
@@ -1,5 +1,7 @@
 """LLM initialization for Agentic ASP solver."""
 
+from langchain_core.caches import RETURN_VAL_TYPE, InMemoryCache
+from langchain_core.outputs import ChatGeneration
 from langchain_openai import ChatOpenAI
 from langchain_ollama import ChatOllama
 from pydantic import SecretStr
@@ -9,6 +11,50 @@ from almasp.utils import get_logger
 
 logger = get_logger()
 
+# Maximum number of LLM responses kept in the opt-in response cache
+LLM_CACHE_MAXSIZE = 1024
+
+# response_metadata flag set on responses replayed from the LLM cache
+CACHE_HIT_KEY = "almasp_cache_hit"
+
+
+class _ReplayMarkingCache(InMemoryCache):
+    """In-memory LLM cache whose replayed responses are flagged as cache hits.
+
+    Stored copies carry CACHE_HIT_KEY in their response_metadata, so usage
+    accounting can tell replayed tokens from tokens actually spent.
+    """
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        """Store flagged copies of the generations for a prompt.
+
+        Args:
+            prompt: Serialized prompt
+            llm_string: Serialized LLM configuration
+            return_val: Generations returned by the provider
+        """
+        marked = []
+        for gen in return_val:
+            if isinstance(gen, ChatGeneration):
+                metadata = {**gen.message.response_metadata, CACHE_HIT_KEY: True}
+                message = gen.message.model_copy(update={"response_metadata": metadata})
+                gen = gen.model_copy(update={"message": message})
+            marked.append(gen)
+        super().update(prompt, llm_string, marked)
+
+
+_llm_cache: _ReplayMarkingCache | None = None
+
+
+def _get_llm_cache() -> _ReplayMarkingCache:
+    """Return the response cache shared by LLMs built with llm_cache enabled."""
+    global _llm_cache
+    if _llm_cache is None:
+        _llm_cache = _ReplayMarkingCache(maxsize=LLM_CACHE_MAXSIZE)
+        logger.debug("Created in-memory LLM cache (maxsize=%d)", LLM_CACHE_MAXSIZE)
+    return _llm_cache
+
+
 def build_llm(config: ASPSystemConfig) -> ChatOpenAI | ChatOllama:
     """Construct and return a chat LLM instance based on the ASP system config.
 
@@ -18,6 +64,8 @@ def build_llm(config: ASPSystemConfig) -> ChatOpenAI | ChatOllama:
     Returns:
         Configured ChatOpenAI or ChatOllama instance with reasoning support
     """
+    # Opt-in only: a cache replays the same answer even at temperature > 0
+    cache = _get_llm_cache() if config.llm_cache else None
 
     # Build LLM based on specified type
     # ChatOllama
@@ -30,6 +78,7 @@ def build_llm(config: ASPSystemConfig) -> ChatOpenAI | ChatOllama:
             model=config.model_name,
             temperature=config.temperature,
             reasoning=config.reasoning,
+            cache=cache,
         )
     
     # ChatOpenAI
@@ -49,6 +98,7 @@ def build_llm(config: ASPSystemConfig) -> ChatOpenAI | ChatOllama:
             temperature=config.temperature,
             base_url=config.base_url,
             api_key=SecretStr(config.api_key),
+            cache=cache,
         )
         # if config.reasoning:
         #     effort = config.reasoning if isinstance(config.reasoning, str) else "medium"
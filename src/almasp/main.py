@@ -4,15 +4,12 @@ import asyncio
 import os
 from pathlib import Path
 
-from dotenv import load_dotenv
-
 from almasp.cli import build_cli_parser, validate_cli_args
-from almasp.config import ASPSystemConfig
-from almasp.runner import ASPRunner
+from almasp.config import ASPSystemConfig, load_env
 from almasp.utils import export_solution, setup_logger
 
 # Load environment variables first
-load_dotenv()
+load_env()
 
 
 async def main() -> None:
@@ -53,6 +50,9 @@ async def main() -> None:
             print("See .env.example for reference.")
             return
 
+        # Import the agent stack only once the arguments are known to be valid
+        from almasp.runner import ASPRunner
+
         # Create and run solver
         try:
             runner = ASPRunner(config, logger)
@@ -94,7 +94,8 @@ async def main() -> None:
     except KeyboardInterrupt:
         logger.info("Interrupted by user")
     except Exception as e:
-        logger.error(f"Fatal error: {e}")
+        # Keep the traceback in the problem log for diagnosis
+        logger.exception(f"Fatal error: {e}")
         raise SystemExit(1)
 
 
@@ -1,15 +1,132 @@
 """MCP Client management for Agentic ASP solver."""
 
+import os
+import shutil
+import time
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import AsyncIterator
 
+from langchain_core.tools import BaseTool
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
+from mcp.types import Tool
 
 from almasp.config import ASPSystemConfig, MCPServerConfig
 from almasp.exceptions import MCPError, classify_exception
 
+# Seconds before cached MCP tool definitions are listed again
+TOOL_DEFINITION_TTL = 300.0
+
+# MCP tool definitions and their monotonic load time, per server config
+_TOOL_DEFINITION_CACHE: dict[MCPServerConfig, tuple[float, list[Tool]]] = {}
+
+
+def clear_tool_definition_cache() -> None:
+    """Forget cached MCP tool definitions so the next session lists them again."""
+    _TOOL_DEFINITION_CACHE.clear()
+
+
+# Resolved executables per (command, PATH); misses are not cached
+_WHICH_CACHE: dict[tuple[str, str], str] = {}
+
+
+def _which(command: str, path: str) -> str | None:
+    """Resolve a command on a PATH string, caching successful lookups.
+
+    Misses are looked up again on every call, so a command installed
+    while the process runs is found without a restart.
+
+    Args:
+        command: Executable name or path
+        path: PATH value to search
+
+    Returns:
+        Full path to the executable, or None if not found
+    """
+    key = (command, path)
+    resolved = _WHICH_CACHE.get(key)
+    if resolved is None:
+        resolved = shutil.which(command, path=path)
+        if resolved is not None:
+            _WHICH_CACHE[key] = resolved
+    return resolved
+
+
+@lru_cache(maxsize=16)
+def _validate_solver_directory(directory_path: str) -> None:
+    """Check that a path is an mcp-solver checkout, once per valid path.
+
+    Only successful checks are cached; invalid paths raise every time.
+
+    Args:
+        directory_path: Value of the --directory argument
+
+    Raises:
+        MCPError: If directory path is invalid
+    """
+    dir_path = Path(directory_path)
+
+    if not dir_path.exists():
+        raise MCPError(
+            f"MCP solver directory not found: {directory_path}\n"
+            f"Please check MCP_SOLVER_ARGS in your .env file.\n"
+            f"The path must be absolute (e.g., /home/user/mcp-solver or C:/dev/mcp-solver)"
+        )
+
+    if not dir_path.is_dir():
+        raise MCPError(
+            f"MCP solver path is not a directory: {directory_path}\n"
+            f"Please provide the path to the mcp-solver folder."
+        )
+
+    # Check if pyproject.toml exists (indicates it's the right directory)
+    pyproject = dir_path / "pyproject.toml"
+    if not pyproject.exists():
+        raise MCPError(
+            f"Directory {directory_path} doesn't appear to be an mcp-solver installation.\n"
+            f"No pyproject.toml found. Did you clone the mcp-solver repository here?\n"
+            f"Expected: git clone https://github.com/szeider/mcp-solver.git"
+        )
+
+
+async def load_session_tools(
+    session: ClientSession, server_config: MCPServerConfig
+) -> list[BaseTool]:
+    """Load LangChain tools bound to a session, listing each server rarely.
+
+    The tools/list round-trip is paid on the first session for a server;
+    sessions within TOOL_DEFINITION_TTL seconds reuse the cached definitions
+    and only rebind them, so a changed server tool set is picked up after
+    the TTL or clear_tool_definition_cache().
+
+    Args:
+        session: Initialized MCP session the tools will call through
+        server_config: Configuration of the server behind the session
+
+    Returns:
+        List of MCP tools bound to the given session
+    """
+    from langchain_mcp_adapters.tools import convert_mcp_tool_to_langchain_tool
+
+    now = time.monotonic()
+    cached = _TOOL_DEFINITION_CACHE.get(server_config)
+    if cached is not None and now - cached[0] < TOOL_DEFINITION_TTL:
+        definitions = cached[1]
+    else:
+        definitions = []
+        cursor = None
+        while True:
+            page = await session.list_tools(cursor=cursor)
+            definitions.extend(page.tools)
+            cursor = page.nextCursor
+            if not cursor:
+                break
+        _TOOL_DEFINITION_CACHE[server_config] = (now, definitions)
+
+    return [convert_mcp_tool_to_langchain_tool(session, tool) for tool in definitions]
+
 
 class MCPClientManager:
     """Manages MCP client lifecycle and tool loading."""
@@ -45,9 +162,7 @@ class MCPClientManager:
             )
 
         # Check if command exists in PATH
-        import shutil
-
-        if not shutil.which(server_config.command):
+        if not _which(server_config.command, os.environ.get("PATH", os.defpath)):
             raise MCPError(
                 f"Command '{server_config.command}' not found in PATH. "
                 f"Please install it or check your MCP_SOLVER_COMMAND setting. "
@@ -57,41 +172,18 @@ class MCPClientManager:
         # Validate directory path if present in args
         self._validate_directory_arg(server_config.args)
 
-    def _validate_directory_arg(self, args: list[str]) -> None:
+    def _validate_directory_arg(self, args: tuple[str, ...]) -> None:
         """Validate --directory argument if present.
 
         Args:
-            args: List of command arguments
+            args: Command arguments
 
         Raises:
             MCPError: If directory path is invalid
         """
         for i, arg in enumerate(args):
             if arg == "--directory" and i + 1 < len(args):
-                directory_path = args[i + 1]
-                dir_path = Path(directory_path)
-
-                if not dir_path.exists():
-                    raise MCPError(
-                        f"MCP solver directory not found: {directory_path}\n"
-                        f"Please check MCP_SOLVER_ARGS in your .env file.\n"
-                        f"The path must be absolute (e.g., /home/user/mcp-solver or C:/dev/mcp-solver)"
-                    )
-
-                if not dir_path.is_dir():
-                    raise MCPError(
-                        f"MCP solver path is not a directory: {directory_path}\n"
-                        f"Please provide the path to the mcp-solver folder."
-                    )
-
-                # Check if pyproject.toml exists (indicates it's the right directory)
-                pyproject = dir_path / "pyproject.toml"
-                if not pyproject.exists():
-                    raise MCPError(
-                        f"Directory {directory_path} doesn't appear to be an mcp-solver installation.\n"
-                        f"No pyproject.toml found. Did you clone the mcp-solver repository here?\n"
-                        f"Expected: git clone https://github.com/szeider/mcp-solver.git"
-                    )
+                _validate_solver_directory(args[i + 1])
 
     @asynccontextmanager
     async def get_session(
@@ -134,7 +226,7 @@ class MCPClientManager:
             StdioServerParameters for the server
         """
         return StdioServerParameters(
-            command=server_config.command, args=server_config.args
+            command=server_config.command, args=list(server_config.args)
         )
 
     @asynccontextmanager
@@ -9,6 +9,9 @@ from pathlib import Path
 
 from almasp.exceptions import FileError
 
+# Custom prompt file contents per (path, mtime, size); edited files get a new key
+_PROMPT_FILE_CACHE: dict[tuple[str, int, int], str] = {}
+
 SOLVER_SYSTEM_PROMPT = """You are an expert Answer Set Programming (ASP) solver agent.
 
 Your role is to translate problem descriptions into correct ASP code using Clingo syntax.
@@ -124,12 +127,18 @@ class PromptTemplate:
         if custom_path is None:
             return self.default_content
 
-        if not custom_path.exists():
+        try:
+            stat = custom_path.stat()
+        except FileNotFoundError:
             raise FileError(f"Prompt file not found: {custom_path}")
 
-        content = custom_path.read_text(encoding="utf-8")
-        if not content.strip():
-            raise FileError(f"Empty prompt file: {custom_path}")
+        key = (str(custom_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        content = _PROMPT_FILE_CACHE.get(key)
+        if content is None:
+            content = custom_path.read_text(encoding="utf-8")
+            if not content.strip():
+                raise FileError(f"Empty prompt file: {custom_path}")
+            _PROMPT_FILE_CACHE[key] = content
 
         return content
 
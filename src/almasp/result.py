@@ -84,6 +84,27 @@ class SolutionResult:
         )
         return result
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "SolutionResult":
+        """Create result from a dictionary produced by to_dict.
+
+        Args:
+            data: Dictionary representation of a result
+
+        Returns:
+            SolutionResult constructed from the dictionary
+        """
+        stats_dict = data.get("statistics", {})
+        return cls(
+            success=data.get("success", False),
+            asp_code=data.get("asp_code", ""),
+            iterations=data.get("iterations", 0),
+            message=data.get("message", ""),
+            error_code=data.get("error_code"),
+            statistics=UsageStatistics.from_dict(stats_dict) if stats_dict else None,
+            answer_set=data.get("answer_set", ""),
+        )
+
     @classmethod
     def from_state(cls, state: dict, success: bool) -> "SolutionResult":
         """Create result from graph state.
@@ -1,15 +1,17 @@
 """Main runner for ASP problem solving."""
 
+import asyncio
 import logging
 from pathlib import Path
 
 from langchain_core.messages import HumanMessage
 from langgraph.graph.state import CompiledStateGraph
 
+from almasp.cache import ExecutionCache, make_cache_key
 from almasp.config import ASPSystemConfig
 from almasp.exceptions import ASPException, FileError, classify_exception
 from almasp.llm import build_llm
-from almasp.mcp_client import MCPClientManager
+from almasp.mcp_client import MCPClientManager, load_session_tools
 from almasp.prompts import PromptManager
 from almasp.result import SolutionResult
 from almasp.state import ASPState
@@ -48,6 +50,12 @@ class ASPRunner:
             self.logger.error(f"Failed to initialize MCP client manager: {e}")
             raise
 
+        self.execution_cache = (
+            ExecutionCache() if config.execution_cache else None
+        )
+        if self.execution_cache is not None:
+            self.logger.info(f"Execution cache enabled: {self.execution_cache.path}")
+
     async def solve(self, problem_file: Path) -> SolutionResult:
         """Solve an ASP problem from a file.
 
@@ -64,23 +72,50 @@ class ASPRunner:
             self.logger.info(f"Starting Agentic ASP solver for: {problem_file}")
             start_time = time.time()
 
-            # Load problem
-            problem = self._load_problem(problem_file)
+            # Load problem and prompts
+            # File and cache I/O runs in worker threads so concurrent solves
+            # sharing the event loop keep streaming; the reads overlap
+            problem, (solver_prompt, validator_prompt) = await asyncio.gather(
+                asyncio.to_thread(self._load_problem, problem_file),
+                asyncio.to_thread(self._load_prompts),
+            )
             self.logger.info("Problem description loaded successfully")
 
+            # Replay a previous successful run of the same problem if cached
+            cache_key = None
+            if self.execution_cache is not None:
+                cache_key = make_cache_key(
+                    problem,
+                    solver_prompt,
+                    validator_prompt,
+                    self.config.provider,
+                    self.config.model_name,
+                    str(self.config.temperature),
+                    str(self.config.reasoning),
+                    str(self.config.max_iterations),
+                )
+                cached = await asyncio.to_thread(
+                    self.execution_cache.get, cache_key
+                )
+                if cached is not None:
+                    self.logger.info("Execution cache hit, returning stored result")
+                    return SolutionResult.from_dict(cached)
+
             # Create initial state
             state = self._create_initial_state(problem)
 
             # Run with MCP session active for the entire solving process
             async with self.mcp_manager.get_session() as session:
                 # Load tools from the active session
-                from langchain_mcp_adapters.tools import load_mcp_tools
-
-                tools = await load_mcp_tools(session)
+                tools = await load_session_tools(
+                    session, self.config.get_mcp_server("mcp-solver")
+                )
                 self.logger.info(f"Loaded {len(tools)} MCP tools")
 
                 # Create the agent graph
-                app = await self._create_app_with_tools(tools)
+                app = await self._create_app_with_tools(
+                    tools, solver_prompt, validator_prompt
+                )
                 self.logger.info("Agent graph created successfully")
 
                 # Run the graph (session stays open during execution)
@@ -104,6 +139,12 @@ class ASPRunner:
                 result.error_code = "MAX_ITER"
 
             self.logger.info(f"Solving completed in {total_time:.2f} seconds: {result.get_summary()}")
+
+            if cache_key is not None and result.success:
+                await asyncio.to_thread(
+                    self.execution_cache.set, cache_key, result.to_dict()
+                )
+
             return result
 
         except ASPException as e:
@@ -136,11 +177,54 @@ class ASPRunner:
 
         return content
 
-    async def _create_app_with_tools(self, tools):
+    def _load_prompts(self) -> tuple[str, str]:
+        """Load solver and validator system prompts.
+
+        Returns:
+            Tuple of (solver_prompt, validator_prompt)
+
+        Raises:
+            FileError: If a custom prompt file is missing or empty
+        """
+        if self.config.solver_prompt_content:
+            solver_prompt = self.config.solver_prompt_content
+            self.logger.info("Loaded custom Solver system prompt")
+        else:
+            solver_prompt = PromptManager.get_solver_prompt(
+                self.config.solver_prompt_file
+            )
+            if self.config.solver_prompt_file:
+                self.logger.info(
+                    f"Loaded Solver system prompt: {self.config.solver_prompt_file}"
+                )
+            else:
+                self.logger.info("Loaded default Solver system prompt")
+
+        if self.config.validator_prompt_content:
+            validator_prompt = self.config.validator_prompt_content
+            self.logger.info("Loaded custom Validator system prompt")
+        else:
+            validator_prompt = PromptManager.get_validator_prompt(
+                self.config.validator_prompt_file
+            )
+            if self.config.validator_prompt_file:
+                self.logger.info(
+                    f"Loaded Validator system prompt: {self.config.validator_prompt_file}"
+                )
+            else:
+                self.logger.info("Loaded default Validator system prompt")
+
+        return solver_prompt, validator_prompt
+
+    async def _create_app_with_tools(
+        self, tools, solver_prompt: str, validator_prompt: str
+    ):
         """Create the agent graph with provided tools.
 
         Args:
             tools: List of loaded MCP tools
+            solver_prompt: Solver system prompt
+            validator_prompt: Validator system prompt
 
         Returns:
             Compiled LangGraph application
@@ -151,30 +235,13 @@ class ASPRunner:
         llm = build_llm(self.config)
         self.logger.info("Language model initialized successfully")
 
-        # Load prompts
-        solver_prompt = PromptManager.get_solver_prompt(self.config.solver_prompt_file)
-        if self.config.solver_prompt_file:
-            self.logger.info(
-                f"Loaded Solver system prompt: {self.config.solver_prompt_file}"
-            )
-        else:
-            self.logger.info("Loaded default Solver system prompt")
-        validator_prompt = PromptManager.get_validator_prompt(
-            self.config.validator_prompt_file
-        )
-        if self.config.validator_prompt_file:
-            self.logger.info(
-                f"Loaded Validator system prompt: {self.config.validator_prompt_file}"
-            )
-        else:
-            self.logger.info("Loaded default Validator system prompt")
-
         # Create and return the graph
         return await create_asp_system(
             llm=llm,
             tools=tools,
             solver_prompt=solver_prompt,
             validator_prompt=validator_prompt,
+            max_inflight=self.config.mcp_max_inflight,
         )
 
     def _create_initial_state(self, problem: str) -> ASPState:
@@ -199,6 +266,7 @@ class ASPRunner:
             messages=[initial_message],
             problem_description=problem,
             max_iterations=self.config.max_iterations,
+            solver_history_max_messages=self.config.solver_history_max_messages,
         )
 
     async def _run_graph(self, app: CompiledStateGraph, state: ASPState) -> dict:
@@ -219,8 +287,10 @@ class ASPRunner:
         try:
             self.logger.info("Starting graph execution")
 
+            # The graph accepts its state model directly; dumping it first
+            # would serialize every message only for LangGraph to rebuild it
             final_state = await app.ainvoke(
-                state.model_dump(),
+                state,
                 config=get_default_graph_config(),
             )
 
@@ -34,8 +34,9 @@ class ASPState(BaseModel):
     # Chat history
     messages: Annotated[list, add_messages] = Field(default_factory=list)
 
-    # Validation feedback history
-    validation_history: Annotated[list, add_messages] = Field(default_factory=list)
+    # Messages from the latest validation round. Each validator run replaces
+    # them, so memory and checkpoint size stay constant across iterations
+    validation_history: list = Field(default_factory=list)
 
     # Current iteration count
     iteration_count: int = 0
@@ -43,6 +44,9 @@ class ASPState(BaseModel):
     # Maximum iterations allowed
     max_iterations: int = 5
 
+    # Prior solver messages replayed on feedback iterations (0 for all)
+    solver_history_max_messages: int = 20
+
     # Validation status
     is_validated: bool = False
 
@@ -52,6 +56,12 @@ class ASPState(BaseModel):
     # Last validator feedback (for solver to see)
     last_feedback: str = ""
 
+    # Whether the solver's last turn called a model-editing MCP tool
+    model_edited: bool = True
+
+    # Whether the last verdict was confirmed on an unedited model
+    verdict_rechecked: bool = False
+
     # Answer set solution
     answer_set: str = ""
 
@@ -6,8 +6,35 @@ loading results, and configuring file+console logging for ASP runs.
 import re
 import json
 import logging
+import os
+from contextvars import ContextVar
 from pathlib import Path
 
+# Problem file solved by the current asyncio task (set during batch runs)
+current_problem: ContextVar[Path | None] = ContextVar("current_problem", default=None)
+
+
+class ProblemLogFilter(logging.Filter):
+    """Accept only records emitted while solving a given problem.
+
+    Records emitted outside of any problem context are always accepted,
+    so single runs that never set ``current_problem`` log as before.
+    """
+
+    def __init__(self, problem_path: Path):
+        """Initialize the filter for a problem file.
+
+        Args:
+            problem_path: Problem file whose records should pass
+        """
+        super().__init__()
+        self.problem_path = problem_path
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Check whether the record belongs to this filter's problem."""
+        problem = current_problem.get()
+        return problem is None or problem == self.problem_path
+
 
 def read_text_file(prompt_path: Path) -> str:
     """Read text file content from the given path.
@@ -26,6 +53,21 @@ def read_text_file(prompt_path: Path) -> str:
     return prompt_path.read_text(encoding="utf-8")
 
 
+def _write_text_atomic(path: Path, content: str) -> None:
+    """Write text to a file in one call, replacing it atomically.
+
+    Readers never observe a partially written file, even when several batch
+    tasks export at the same time.
+
+    Args:
+        path: Destination file path
+        content: Text to write
+    """
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(content, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
 def export_solution(
     problem_path: Path, results: dict, export_path: Path = Path("results")
 ) -> dict[str, Path]:
@@ -45,15 +87,13 @@ def export_solution(
     exported_files = {}
 
     json_path = base_path.with_suffix(".json")
-    with open(json_path, "w", encoding="utf-8") as json_file:
-        json.dump(results, json_file, indent=4)
+    _write_text_atomic(json_path, json.dumps(results, indent=4))
     exported_files["json"] = json_path
 
     asp_code = results.get("asp_code")
     if asp_code:
         lp_path = base_path.with_suffix(".lp")
-        with open(lp_path, "w", encoding="utf-8") as lp_file:
-            lp_file.write(asp_code)
+        _write_text_atomic(lp_path, asp_code)
         exported_files["lp"] = lp_path
 
     return exported_files
@@ -81,7 +121,9 @@ def setup_logger(
     """Configure logger with file and console handlers for an ASP run.
 
     Creates a log file alongside the solution output and attaches both
-    file (detailed) and console (INFO+) handlers.
+    file (detailed) and console (INFO+) handlers. Both handlers only accept
+    records of this problem when ``current_problem`` is set, so concurrent
+    batch runs write to their own log files.
 
     Args:
         problem_path: Problem file path (used for log file naming)
@@ -99,13 +141,16 @@ def setup_logger(
     logger.setLevel(logging_level)
 
     formatter = logging.Formatter(logging_format)
+    problem_filter = ProblemLogFilter(problem_path)
     file_handler = logging.FileHandler(export_file_path, mode="w")
     file_handler.setFormatter(formatter)
     file_handler.setLevel(logging_level)
+    file_handler.addFilter(problem_filter)
 
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
+    console_handler.addFilter(problem_filter)
 
     logger.addHandler(file_handler)
     logger.addHandler(console_handler)
@@ -122,13 +167,22 @@ def get_logger() -> logging.Logger:
     return logging.getLogger("log")
 
 
-def reset_logger():
-    """Remove and close all handlers from the ASP system logger.
+def reset_logger(problem_path: Path | None = None):
+    """Remove and close handlers from the ASP system logger.
 
     Used to clean up logging configuration between batch runs.
+
+    Args:
+        problem_path: If given, only remove the handlers created by
+            setup_logger for this problem; otherwise remove all handlers
     """
     logger = logging.getLogger("log")
     for handler in list(logger.handlers):
+        if problem_path is not None and not any(
+            isinstance(f, ProblemLogFilter) and f.problem_path == problem_path
+            for f in handler.filters
+        ):
+            continue
         logger.removeHandler(handler)
         handler.close()
     logger.propagate = False
@@ -4,6 +4,8 @@ Provides an interactive UI for solving ASP problems with live logging.
 """
 import os
 import time
+import collections
+import itertools
 import threading
 import asyncio
 import logging
@@ -11,13 +13,13 @@ import tempfile
 import sys
 import subprocess
 from pathlib import Path
-from io import StringIO
 
 import streamlit as st
-from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 
 from almasp.config import ASPSystemConfig
 from almasp.runner import ASPRunner
+from almasp.utils import get_logger
 
 
 # ============================================================================
@@ -27,11 +29,11 @@ from almasp.runner import ASPRunner
 def init_session_state():
     """Initialize all session state variables."""
     defaults = {
-        "run_thread": None,
+        "run_future": None,
         "result": None,
         "error": None,
         "running": False,
-        "log_stream": None,
+        "log_handler": None,
         "stop_requested": False,
         "execution_completed": False,
     }
@@ -53,66 +55,92 @@ def build_config(api_key: str, base_url: str, model_name: str, provider: str,
     os.environ["PROVIDER_BASE_URL"] = base_url
     os.environ["MODEL_NAME"] = model_name
     
-    # Create temporary prompt files if provided
-    solver_prompt_file = _create_temp_prompt_file(solver_prompt_text, "solver")
-    validator_prompt_file = _create_temp_prompt_file(validator_prompt_text, "validator")
-    
     return ASPSystemConfig.from_env(
         model_name=model_name,
         max_iterations=max_iterations,
-        solver_prompt_file=solver_prompt_file,
-        validator_prompt_file=validator_prompt_file,
+        solver_prompt_content=solver_prompt_text if solver_prompt_text.strip() else None,
+        validator_prompt_content=validator_prompt_text if validator_prompt_text.strip() else None,
         provider=provider,
         reasoning=reasoning,
         temperature=temperature,
     )
 
 
-def _create_temp_prompt_file(prompt_text: str, prefix: str) -> str | None:
-    """Create a temporary file for custom prompt text."""
-    if not prompt_text.strip():
-        return None
-    
-    tmp = tempfile.NamedTemporaryFile(
-        suffix=".txt",
-        prefix=f"{prefix}_prompt_",
-        delete=False,
-        mode="w",
-        encoding="utf-8"
-    )
-    tmp.write(prompt_text)
-    tmp.flush()
-    tmp.close()
-    return tmp.name
-
-
 # ============================================================================
 # LOGGING SETUP
 # ============================================================================
 
-def setup_logging(log_stream: StringIO, log_level: str) -> logging.Logger:
-    """Configure logging to capture all output to a string stream."""
+# Maximum number of log lines kept for display
+LOG_BUFFER_MAXLEN = 5000
+
+# Maximum time (seconds) the live log view waits for new lines
+LOG_REFRESH_INTERVAL = 0.5
+
+
+class DequeHandler(logging.Handler):
+    """Logging handler that keeps the most recent formatted lines in memory."""
+
+    def __init__(self, maxlen: int = LOG_BUFFER_MAXLEN):
+        """Initialize the bounded line buffer and the update event."""
+        super().__init__()
+        self.buf: collections.deque[str] = collections.deque(maxlen=maxlen)
+        self.updated = threading.Event()
+        self.count = 0  # Total lines appended, changes even when buf is full
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Format and store a log record."""
+        try:
+            self.write(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+    def write(self, line: str) -> None:
+        """Append a raw line and notify waiting readers."""
+        with self.lock:
+            self.buf.append(line)
+            self.count += 1
+        self.updated.set()
+
+    def getvalue(self) -> str:
+        """Return the buffered lines as a single string."""
+        with self.lock:
+            return "\n".join(self.buf)
+
+    def lines_since(self, count: int) -> tuple[list[str], int]:
+        """Return the buffered lines written after the first `count` lines.
+
+        Args:
+            count: Number of lines already consumed by the reader
+
+        Returns:
+            Tuple of (new lines still in the buffer, total lines written)
+        """
+        with self.lock:
+            new = min(self.count - count, len(self.buf))
+            lines = list(itertools.islice(self.buf, len(self.buf) - new, None))
+            return lines, self.count
+
+
+def setup_logging(handler: DequeHandler, log_level: str) -> logging.Logger:
+    """Configure logging to capture all output to an in-memory buffer."""
     # Main webapp logger
     logger = logging.getLogger("almasp_webapp")
     logger.setLevel(getattr(logging, log_level))
     logger.handlers.clear()
     logger.propagate = False
     
-    # Create handler
-    handler = logging.StreamHandler(log_stream)
+    # Configure handler
     handler.setLevel(getattr(logging, log_level))
     formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
     handler.setFormatter(formatter)
     logger.addHandler(handler)
     
-    # Capture all "log" module loggers (including submodules)
-    for logger_name in list(logging.Logger.manager.loggerDict.keys()):
-        if logger_name.startswith("log"):
-            sub_logger = logging.getLogger(logger_name)
-            sub_logger.setLevel(getattr(logging, log_level))
-            sub_logger.handlers.clear()
-            sub_logger.propagate = False
-            sub_logger.addHandler(handler)
+    # Capture the package logger; its child loggers propagate to it
+    package_logger = get_logger()
+    package_logger.setLevel(getattr(logging, log_level))
+    package_logger.handlers.clear()
+    package_logger.propagate = False
+    package_logger.addHandler(handler)
     
     return logger
 
@@ -121,24 +149,36 @@ def setup_logging(log_stream: StringIO, log_level: str) -> logging.Logger:
 # BACKGROUND EXECUTION
 # ============================================================================
 
-def background_run(problem: str, log_level: str, config: ASPSystemConfig):
+@st.cache_resource
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """Return the process-wide event loop running in a daemon thread.
+
+    The loop is created once and shared by all runs, so each Solve click
+    only submits a coroutine instead of starting a new thread and loop.
     """
-    Background thread target: run the ASP solver.
-    Updates session state with results and logs.
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="almasp-loop", daemon=True).start()
+    return loop
+
+
+async def background_run(problem: str, log_level: str, config: ASPSystemConfig, session_state):
+    """
+    Background coroutine: run the ASP solver on the shared event loop.
+    Updates the given session state with results and logs.
     """
     tmp_file = None
-    task = None
+    logger = logging.getLogger("almasp_webapp")
     
     try:
         # Setup logging
-        log_stream = StringIO()
-        st.session_state.log_stream = log_stream
-        logger = setup_logging(log_stream, log_level)
+        log_handler = DequeHandler()
+        session_state.log_handler = log_handler
+        logger = setup_logging(log_handler, log_level)
         
         logger.info("Starting ASP solver...")
 
         # Check for early stop
-        if st.session_state.stop_requested:
+        if session_state.stop_requested:
             logger.warning("Execution stopped by user before starting")
             return
 
@@ -150,36 +190,33 @@ def background_run(problem: str, log_level: str, config: ASPSystemConfig):
         runner = ASPRunner(config, logger)
         logger.info("Running solver...")
         
-        # Execute with cancellation support
-        task = _run_with_cancellation(runner, tmp_path, logger)
+        # Execute (cancelled by the Stop button through the run future)
+        result = await runner.solve(tmp_path)
         
-        if task and not st.session_state.stop_requested:
-            st.session_state.result = task
+        if result and not session_state.stop_requested:
+            session_state.result = result
             logger.info("Execution completed")
-            st.session_state.execution_completed = True
+            session_state.execution_completed = True
 
     except asyncio.CancelledError:
         logger.warning("Execution cancelled by user")
-        st.session_state.error = "Execution stopped by user"
-        st.session_state.execution_completed = True
+        session_state.error = "Execution stopped by user"
+        session_state.execution_completed = True
+        raise
         
     except Exception as e:
         import traceback
         error_msg = f"{str(e)}\n\n{traceback.format_exc()}"
-        st.session_state.error = error_msg
-        st.session_state.execution_completed = True
-        try:
-            if 'logger' in locals():
-                logger.error(f"Run failed: {error_msg}")
-        except:
-            pass
+        session_state.error = error_msg
+        session_state.execution_completed = True
+        logger.error(f"Run failed: {error_msg}")
             
     finally:
         # Cleanup
         _cleanup_temp_file(tmp_file)
-        st.session_state.running = False
-        st.session_state.run_thread = None
-        st.session_state.stop_requested = False
+        session_state.running = False
+        session_state.run_future = None
+        session_state.stop_requested = False
 
 
 def _create_problem_file(problem: str):
@@ -197,34 +234,6 @@ def _create_problem_file(problem: str):
     return tmp_file
 
 
-def _run_with_cancellation(runner: ASPRunner, problem_path: Path, logger: logging.Logger):
-    """Run the solver with support for cancellation via stop button."""
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    
-    try:
-        task = loop.create_task(runner.solve(problem_path))
-        
-        # Poll for completion or stop request
-        while not task.done():
-            if st.session_state.stop_requested:
-                logger.warning("Stop requested - cancelling task...")
-                task.cancel()
-                try:
-                    loop.run_until_complete(task)
-                except asyncio.CancelledError:
-                    logger.info("Task cancelled successfully")
-                    st.session_state.error = "Execution stopped by user"
-                return None
-            
-            loop.run_until_complete(asyncio.sleep(0.1))
-        
-        return task.result()
-        
-    finally:
-        loop.close()
-
-
 def _cleanup_temp_file(tmp_file):
     """Clean up temporary file."""
     if tmp_file:
@@ -239,29 +248,23 @@ def _cleanup_temp_file(tmp_file):
 # ============================================================================
 
 def start_run(problem_text: str, log_level: str, config: ASPSystemConfig):
-    """Start the solver execution in a background thread."""
+    """Submit the solver execution to the background event loop."""
     # Reset state
     st.session_state.result = None
     st.session_state.error = None
     st.session_state.running = True
-    st.session_state.log_stream = None
+    st.session_state.log_handler = None
     st.session_state.stop_requested = False
     st.session_state.execution_completed = False
 
-    # Create and start thread
-    t = threading.Thread(
-        target=background_run,
-        args=(problem_text, log_level, config),
-        daemon=True
-    )
-    
-    # Add script context to suppress warnings
+    # The loop thread has no script context, so hand it this session's state
     ctx = get_script_run_ctx()
-    if ctx:
-        add_script_run_ctx(t, ctx)
-    
-    st.session_state.run_thread = t
-    t.start()
+    session_state = ctx.session_state if ctx else st.session_state
+
+    st.session_state.run_future = asyncio.run_coroutine_threadsafe(
+        background_run(problem_text, log_level, config, session_state),
+        get_background_loop(),
+    )
 
 
 def stop_run():
@@ -269,17 +272,61 @@ def stop_run():
     st.session_state.stop_requested = True
     st.session_state.running = False
     st.session_state.execution_completed = True
-    if st.session_state.log_stream:
-        st.session_state.log_stream.write("\n\n[STOP REQUESTED BY USER]\n")
+    st.session_state.error = "Execution stopped by user"
+
+    # Cancel the solver task on the background loop
+    if st.session_state.run_future:
+        st.session_state.run_future.cancel()
+    if st.session_state.log_handler:
+        st.session_state.log_handler.write("\n[STOP REQUESTED BY USER]")
 
 
 def get_log_content() -> str:
-    """Get current log content from the stream."""
-    if st.session_state.log_stream:
-        return st.session_state.log_stream.getvalue()
+    """Get current log content from the buffer."""
+    if st.session_state.log_handler:
+        return st.session_state.log_handler.getvalue()
     return "Initializing..."
 
 
+def wait_for_log_update(timeout: float = LOG_REFRESH_INTERVAL) -> None:
+    """Block until new log lines are written or the timeout expires."""
+    handler = st.session_state.log_handler
+    if handler is None:
+        time.sleep(timeout)
+        return
+    handler.updated.wait(timeout)
+    handler.updated.clear()
+
+
+def stream_log_chunks():
+    """Yield newly logged lines as they arrive while a run is active.
+
+    Each chunk holds only the lines written since the previous one, so the
+    live view appends them instead of re-sending the whole log.
+    """
+    seen = 0
+    handler = None
+    while st.session_state.running:
+        handler = st.session_state.log_handler
+        if handler is not None:
+            lines, seen = handler.lines_since(seen)
+            if lines:
+                yield "\n".join(lines)
+
+        wait_for_log_update()
+
+        # Safety check - run finished but running is still True
+        if st.session_state.run_future and st.session_state.run_future.done():
+            st.session_state.running = False
+            st.session_state.execution_completed = True
+
+    # Flush lines written while the run was finishing
+    if handler is not None:
+        lines, _ = handler.lines_since(seen)
+        if lines:
+            yield "\n".join(lines)
+
+
 # ============================================================================
 # UI RENDERING
 # ============================================================================
@@ -378,26 +425,12 @@ def render_control_buttons():
 
 def render_live_logs(tab_logs):
     """Render live updating logs during execution."""
-    log_placeholder = tab_logs.empty()
+    log_box = tab_logs.container()
     
     with st.spinner("Running agent..."):
-        while st.session_state.running:
-            log_text = get_log_content()
-            with log_placeholder.container():
-                st.code(log_text, language="text")
-            
-            time.sleep(0.5)
-            
-            # Safety check - thread died but running is still True
-            if st.session_state.run_thread and not st.session_state.run_thread.is_alive():
-                st.session_state.running = False
-                st.session_state.execution_completed = True
-                break
-        
-        # Final log update after loop exits
-        log_text = get_log_content()
-        with log_placeholder.container():
-            st.code(log_text, language="text")
+        # Append only the new lines as they are logged
+        for chunk in stream_log_chunks():
+            log_box.text(chunk)
 
 
 def render_completed_logs(tab_logs):
@@ -415,24 +448,10 @@ def render_logs_column(log_container):
         log_placeholder = st.empty()
         
         if st.session_state.running:
-            # Live updating logs
-            while st.session_state.running:
-                log_text = get_log_content()
-                with log_placeholder.container():
-                    st.code(log_text, language="text", height=600)
-                
-                time.sleep(0.5)
-                
-                # Safety check
-                if st.session_state.run_thread and not st.session_state.run_thread.is_alive():
-                    st.session_state.running = False
-                    st.session_state.execution_completed = True
-                    break
-            
-            # Final update
-            log_text = get_log_content()
-            with log_placeholder.container():
-                st.code(log_text, language="text", height=600)
+            # Live logs: append only the new lines as they are logged
+            log_box = log_placeholder.container(height=600)
+            for chunk in stream_log_chunks():
+                log_box.text(chunk)
         else:
             # Show logs from completed run or idle message
             log_text = get_log_content()
@@ -520,9 +539,9 @@ def main():
                     st.error(f"Configuration error: {str(e)}\n\n{traceback.format_exc()}")
         
         if stop_btn:
+            # The rest of this run renders the stopped state; the
+            # execution_completed rerun at the end refreshes the buttons
             stop_run()
-            time.sleep(0.5)
-            st.rerun()
         
         # Results section
         st.markdown("---")
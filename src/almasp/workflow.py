@@ -5,22 +5,38 @@ provides feedback), should_continue routing, and helper functions for message
 creation and agent invocation with token/tool usage tracking.
 """
 
+import logging
 from typing import Literal
 
 from anyio import ClosedResourceError
-from langchain_core.messages import AnyMessage, HumanMessage
+from ollama import ResponseError as OllamaResponseError
+from openai import NotFoundError as OpenAINotFoundError
+from langchain_core.messages import AnyMessage, HumanMessage, trim_messages
 from langgraph.graph.state import CompiledStateGraph
 
+from almasp.llm import CACHE_HIT_KEY
 from almasp.state import ASPState
 from almasp.utils import analyze_asp_code, get_logger
 from langchain_core.runnables import RunnableConfig
 
 logger = get_logger()
 
+
 def get_default_graph_config(
     thread_id: str = "1",
     recursion_limit: int = 100,
 ) -> RunnableConfig:
+    """Return the runnable config used to invoke graphs and agents.
+
+    Each call builds a new config, so callers and LangGraph may mutate it.
+
+    Args:
+        thread_id: Checkpointer thread identifier
+        recursion_limit: Maximum number of graph steps
+
+    Returns:
+        RunnableConfig with the thread id and recursion limit
+    """
     return RunnableConfig(
         {
             "configurable": {"thread_id": thread_id},
@@ -29,6 +45,37 @@ def get_default_graph_config(
     )
 
 
+_EMPTY_USAGE: dict = {}
+
+
+def _extract_usage(msg: AnyMessage) -> tuple[int, int, int]:
+    """Extract token counts from an LLM message.
+
+    Prefers LangChain's usage_metadata and falls back to the provider's
+    raw token_usage from response_metadata. Responses replayed from the LLM
+    cache spent no tokens and count as zero.
+
+    Args:
+        msg: Message produced by an LLM call
+
+    Returns:
+        Tuple of (input_tokens, output_tokens, total_tokens)
+    """
+    if msg.response_metadata.get(CACHE_HIT_KEY):
+        return 0, 0, 0
+    usage = (
+        getattr(msg, "usage_metadata", None)
+        or msg.response_metadata.get("token_usage")
+        or _EMPTY_USAGE
+    )
+    get = usage.get
+    return (
+        get("input_tokens") or get("prompt_tokens", 0),
+        get("output_tokens") or get("completion_tokens", 0),
+        get("total_tokens", 0),
+    )
+
+
 async def call_agent(history: list[AnyMessage], agent: CompiledStateGraph) -> dict:
     """Invoke a ReAct agent and collect messages plus usage statistics.
 
@@ -46,7 +93,10 @@ async def call_agent(history: list[AnyMessage], agent: CompiledStateGraph) -> di
         RuntimeError: If model not found (404 error)
     """
     messages = []
-    stats = {"input_tokens": 0, "output_tokens": 0, "total_tokens": 0, "tool_calls": 0}
+    input_total = output_total = tokens_total = tool_calls = 0
+    # Per-message log lines need a scan of the tool output, so skip the
+    # work entirely when INFO is disabled (e.g. quiet batch runs)
+    log_info = logger.isEnabledFor(logging.INFO)
     try:
         logger.debug("Starting agent astream with %d history messages", len(history))
         async for chunk in agent.astream(
@@ -54,75 +104,75 @@ async def call_agent(history: list[AnyMessage], agent: CompiledStateGraph) -> di
             config=get_default_graph_config(),
             stream_mode="updates",
         ):
-            if not chunk:
-                continue
-            node_name = next(iter(chunk.keys()))
-            node_output = chunk[node_name]
-
-            if "messages" in node_output:
-                for msg in node_output["messages"]:
-                    if node_name == "tools":
-                        operation_name = msg.name
-                        stats["tool_calls"] += 1
-                        outcome = (
-                            "failed"
-                            if "Failed" in getattr(msg, "content", "")
-                            or "Error" in getattr(msg, "content", "")
-                            else "success"
-                        )
-                        logger.info(
-                            "%s %s operation %s", node_name, operation_name, outcome
-                        )
+            # A chunk can carry updates from several nodes (e.g. middleware hooks)
+            for node_name, node_output in chunk.items():
+                msgs = (
+                    node_output.get("messages")
+                    if isinstance(node_output, dict)
+                    else None
+                )
+                if not msgs:
+                    logger.debug(
+                        "%s produced a non-message update: %s", node_name, node_output
+                    )
+                    continue
+                is_tools = node_name == "tools"
+                for msg in msgs:
+                    if is_tools:
+                        tool_calls += 1
+                        if log_info:
+                            content = getattr(msg, "content", "")
+                            outcome = (
+                                "failed"
+                                if "Failed" in content or "Error" in content
+                                else "success"
+                            )
+                            logger.info(
+                                "%s %s operation %s", node_name, msg.name, outcome
+                            )
                     else:
-                        usage = getattr(
-                            msg, "usage_metadata", None
-                        ) or msg.response_metadata.get("token_usage", {})
-                        input_tokens = usage.get("input_tokens") or usage.get(
-                            "prompt_tokens", 0
-                        )
-                        output_tokens = usage.get("output_tokens") or usage.get(
-                            "completion_tokens", 0
-                        )
-                        total_tokens = usage.get("total_tokens", 0)
-                        if hasattr(msg, "tool_calls") and msg.tool_calls:
-                            for operation in msg.tool_calls:
-                                operation_name = operation.get("name")
+                        input_tokens, output_tokens, total_tokens = _extract_usage(msg)
+                        if log_info:
+                            if hasattr(msg, "tool_calls") and msg.tool_calls:
+                                for operation in msg.tool_calls:
+                                    operation_name = operation.get("name")
+                                    logger.info(
+                                        "%s called tool: %s ---- Input Tokens: %s | Output Tokens: %s | Total Tokens: %s",
+                                        node_name,
+                                        operation_name,
+                                        input_tokens,
+                                        output_tokens,
+                                        total_tokens,
+                                    )
+                            else:
                                 logger.info(
-                                    "%s called tool: %s ---- Input Tokens: %s | Output Tokens: %s | Total Tokens: %s",
+                                    "%s called LLM ---- Input Tokens: %s | Output Tokens: %s | Total Tokens: %s",
                                     node_name,
-                                    operation_name,
                                     input_tokens,
                                     output_tokens,
                                     total_tokens,
                                 )
-                        else:
-                            logger.info(
-                                "%s called LLM ---- Input Tokens: %s | Output Tokens: %s | Total Tokens: %s",
-                                node_name,
-                                input_tokens,
-                                output_tokens,
-                                total_tokens,
-                            )
-                        stats["input_tokens"] += input_tokens
-                        stats["output_tokens"] += output_tokens
-                        stats["total_tokens"] += total_tokens
+                        input_total += input_tokens
+                        output_total += output_tokens
+                        tokens_total += total_tokens
                     messages.append(msg)
-            else:
-                logger.debug(
-                    "%s produced a non-message update: %s",
-                    node_name,
-                    list(node_output.keys()),
-                )
         logger.debug("Agent astream completed with %d messages", len(messages))
+    except (OpenAINotFoundError, OllamaResponseError) as e:
+        logger.error("Agent stream raised exception: %s", e)
+        # A 404 from either provider means the model does not exist; retrying won't help
+        if getattr(e, "status_code", None) == 404:
+            raise RuntimeError(f"MODEL_NOT_FOUND: {e}") from e
+        raise
     except Exception as e:
-        msg = str(e)
-        lowered = msg.lower()
-        logger.error("Agent stream raised exception: %s", msg)
-        if ("404" in lowered or "not found" in lowered) and "model" in lowered:
-            raise RuntimeError(f"MODEL_NOT_FOUND: {msg}")
-        else:
-            raise
-
+        logger.error("Agent stream raised exception: %s", e)
+        raise
+
+    stats = {
+        "input_tokens": input_total,
+        "output_tokens": output_total,
+        "total_tokens": tokens_total,
+        "tool_calls": tool_calls,
+    }
     return {"messages": messages, "statistics": stats}
 
 
@@ -131,8 +181,16 @@ def create_solver_message(
 ) -> list[AnyMessage]:
     """Create focused message for solver agent.
 
+    Every call starts with the same problem message, so the system prompt
+    and problem description form a byte-identical prefix that OpenAI and
+    Ollama can serve from their prompt caches.
+
     First iteration: presents the problem description.
-    Later iterations: includes validator feedback and current ASP code.
+    Later iterations: replays the problem, the most recent solver history
+    (capped at state.solver_history_max_messages, 0 for no cap), then
+    validator feedback and the current ASP code. The feedback already carries
+    the current code, so older turns only add tokens to every request. The
+    state's message list is never modified.
 
     Args:
         state: Current ASP workflow state
@@ -141,24 +199,33 @@ def create_solver_message(
     Returns:
         List of messages to send to solver agent
     """
-    if is_first_iteration:
-        content = f"""Problem to solve:
+    problem = HumanMessage(
+        content=f"""Problem to solve:
 
 {state.problem_description}
 
 Please create an ASP encoding for this problem using the MCP Solver tools.
 Build the encoding step by step and test it with solve_model when ready."""
-        return [HumanMessage(content=content)]
+    )
+    if is_first_iteration:
+        return [problem]
     else:
-        messages = state.messages
         content = f"""A validator expert in Answer Set Programming provided this feedback on your ASP code:
 
 {state.last_feedback if state.last_feedback else "The code do not model correctly the problem."}
 {f"\n\nCurrent ASP code state:\n{state.asp_code}\n\n" if state.asp_code else ""}
 Please address the feedback and improve the encoding using the MCP Solver tools."""
 
-        messages.append(HumanMessage(content=content))
-        return messages
+        history = state.messages
+        if state.solver_history_max_messages:
+            history = trim_messages(
+                history,
+                max_tokens=state.solver_history_max_messages,
+                token_counter=len,
+                strategy="last",
+                start_on="ai",
+            )
+        return [problem, *history, HumanMessage(content=content)]
 
 
 def create_validator_message(state: ASPState) -> list[AnyMessage]:
@@ -180,7 +247,11 @@ Use solve_model to test it and provide clear feedback on whether it's correct.""
     return [HumanMessage(content=content)]
 
 
-async def solver_node(state: ASPState, solver_agent: CompiledStateGraph) -> dict:
+async def solver_node(
+    state: ASPState,
+    solver_agent: CompiledStateGraph,
+    edit_tool_names: frozenset[str] | None = None,
+) -> dict:
     """Solver agent node - generates or improves ASP code.
 
     Invokes the solver ReAct agent with problem description (first iteration)
@@ -189,6 +260,8 @@ async def solver_node(state: ASPState, solver_agent: CompiledStateGraph) -> dict
     Args:
         state: Current workflow state
         solver_agent: Compiled solver agent graph
+        edit_tool_names: Names of the loaded MCP tools that can change the
+            model; None treats every turn as an edit
 
     Returns:
         State updates: incremented iteration_count, new messages, asp_code,
@@ -203,12 +276,21 @@ async def solver_node(state: ASPState, solver_agent: CompiledStateGraph) -> dict
     try:
         result = await call_agent(messages, solver_agent)
 
+        # Attempted edits count even if the tool failed, to stay conservative
+        model_edited = edit_tool_names is None or any(
+            call.get("name") in edit_tool_names
+            for msg in result["messages"]
+            for call in getattr(msg, "tool_calls", None) or ()
+        )
+
         return {
             "iteration_count": state.iteration_count + 1,
             "messages": result["messages"],
             "asp_code": result["messages"][-1].content,
             "is_validated": False,
-            "last_feedback": "",
+            # Keep the feedback for an unchanged model so the validator can reuse it
+            "last_feedback": "" if model_edited else state.last_feedback,
+            "model_edited": model_edited,
             "statistics": result["statistics"],
         }
     except ClosedResourceError as e:
@@ -228,7 +310,9 @@ async def validator_node(state: ASPState, validator_agent: CompiledStateGraph) -
     """Validate ASP code against problem requirements.
 
     Test the current ASP code using MCP tools and determine PASS/FAIL.
-    Skip validation if no code is present.
+    Skip validation if the workflow already failed. When the solver leaves
+    the MCP model unchanged, validate it once more to rule out a flaky
+    verdict, then reuse that verdict until the model is edited again.
 
     Args:
         state: Current workflow state
@@ -248,7 +332,12 @@ async def validator_node(state: ASPState, validator_agent: CompiledStateGraph) -
             "messages": state.messages,
             "last_feedback": "Validation skipped due to existing error in workflow.",
         }
-    
+
+    # The validator only reads the model, so a rechecked unedited model keeps its verdict
+    if not state.model_edited and state.last_feedback and state.verdict_rechecked:
+        logger.info("Validator reused previous feedback: ASP model unchanged")
+        return {"is_validated": False}
+
     try:
         result = await call_agent(message, validator_agent)
 
@@ -268,6 +357,8 @@ async def validator_node(state: ASPState, validator_agent: CompiledStateGraph) -
             "last_feedback": agent_response,
             "asp_code": postprocessed_asp_code if is_valid else state.asp_code,
             "validation_history": result["messages"],
+            # Validating an unedited model confirms the previous verdict
+            "verdict_rechecked": not state.model_edited,
             "statistics": result["statistics"],
         }
     except ClosedResourceError as e:
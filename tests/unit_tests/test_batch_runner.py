@@ -0,0 +1,104 @@
+"""Batch runner tests."""
+
+import asyncio
+
+import pytest
+
+import almasp.runner
+from almasp.batch_runner import find_problem_files, run_for_file
+from almasp.cli import build_batch_cli_parser
+from almasp.config import ASPSystemConfig
+from almasp.result import SolutionResult
+from almasp.utils import get_logger
+
+
+def make_tree(root):
+    for year in ("2022", "2023"):
+        year_dir = root / f"lpcp-{year}"
+        year_dir.mkdir()
+        for name in ("problem-2.md", "problem-1.md", "notes.md"):
+            (year_dir / name).write_text("p")
+    (root / "other").mkdir()
+    (root / "other" / "problem-1.md").write_text("p")
+
+
+class TestFindProblemFiles:
+    """Test problem file discovery."""
+
+    def test_finds_all_years_sorted(self, tmp_path):
+        make_tree(tmp_path)
+
+        files = find_problem_files(tmp_path)
+
+        assert [f.relative_to(tmp_path).as_posix() for f in files] == [
+            "lpcp-2022/problem-1.md",
+            "lpcp-2022/problem-2.md",
+            "lpcp-2023/problem-1.md",
+            "lpcp-2023/problem-2.md",
+        ]
+
+    def test_filters_years_and_skips_missing(self, tmp_path):
+        make_tree(tmp_path)
+
+        files = find_problem_files(tmp_path, ["2023", "2030"])
+
+        assert [f.relative_to(tmp_path).as_posix() for f in files] == [
+            "lpcp-2023/problem-1.md",
+            "lpcp-2023/problem-2.md",
+        ]
+
+    def test_filters_by_name_pattern(self, tmp_path):
+        make_tree(tmp_path)
+
+        files = find_problem_files(tmp_path, pattern=r"-1\.md$")
+
+        assert [f.relative_to(tmp_path).as_posix() for f in files] == [
+            "lpcp-2022/problem-1.md",
+            "lpcp-2023/problem-1.md",
+        ]
+
+
+class TestRunForFile:
+    """Test the per-problem outcome reported to the batch summary."""
+
+    @pytest.mark.parametrize("success", [True, False])
+    def test_reports_solver_outcome(self, tmp_path, monkeypatch, success):
+        class FakeSolver:
+            async def solve(self, problem_file):
+                return SolutionResult(
+                    success=success, asp_code="a.", iterations=1, message=""
+                )
+
+        class FakeBatchRunner:
+            def __init__(self, config, logger):
+                self.runner = FakeSolver()
+
+        monkeypatch.setattr(almasp.runner, "BatchRunner", FakeBatchRunner)
+        # reset_logger stops propagation; restore it so pytest's capture
+        # handlers are not attached to the package logger in later tests
+        monkeypatch.setattr(get_logger(), "propagate", get_logger().propagate)
+        problem_file = tmp_path / "problem-1.md"
+        problem_file.write_text("p")
+
+        outcome = asyncio.run(
+            run_for_file(problem_file, ASPSystemConfig(), tmp_path / "results")
+        )
+
+        assert outcome is success
+
+
+class TestBatchCliParser:
+    """Test batch CLI defaults."""
+
+    def test_concurrency_defaults_to_sequential(self, monkeypatch, tmp_path):
+        monkeypatch.delenv("MAX_CONCURRENCY", raising=False)
+
+        args = build_batch_cli_parser().parse_args(["--root", str(tmp_path)])
+
+        assert args.concurrency == 1
+
+    def test_invalid_env_concurrency_is_a_usage_error(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("MAX_CONCURRENCY", "many")
+
+        with pytest.raises(SystemExit):
+            build_batch_cli_parser().parse_args(["--root", str(tmp_path)])
@@ -0,0 +1,40 @@
+"""Execution cache tests."""
+
+from almasp.cache import ExecutionCache, make_cache_key
+from almasp.result import SolutionResult, UsageStatistics
+
+
+class TestCacheKey:
+    """Test cache key construction."""
+
+    def test_key_is_stable(self):
+        assert make_cache_key("problem", "prompt") == make_cache_key(
+            "problem", "prompt"
+        )
+
+    def test_key_changes_with_prompt(self):
+        assert make_cache_key("problem", "a") != make_cache_key("problem", "b")
+
+
+class TestExecutionCache:
+    """Test the SQLite-backed execution cache."""
+
+    def test_miss_returns_none(self, tmp_path):
+        cache = ExecutionCache(tmp_path / "cache.sqlite")
+
+        assert cache.get("missing") is None
+
+    def test_roundtrip_result(self, tmp_path):
+        cache = ExecutionCache(tmp_path / "cache.sqlite")
+        result = SolutionResult(
+            success=True,
+            asp_code="a.",
+            iterations=2,
+            message="VALIDATION PASSED",
+            statistics=UsageStatistics(total_tokens=10, tool_calls=3),
+        )
+
+        cache.set("key", result.to_dict())
+        restored = SolutionResult.from_dict(cache.get("key"))
+
+        assert restored.to_dict() == result.to_dict()
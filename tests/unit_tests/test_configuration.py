@@ -6,6 +6,9 @@ from pathlib import Path
 
 import pytest
 from dotenv import load_dotenv
+from pydantic import ValidationError
+
+from almasp.config import ASPSystemConfig, MCPServerConfig
 
 load_dotenv()
 
@@ -164,3 +167,55 @@ class TestModelConfiguration:
             assert value > 0, "MAX_ITERATIONS should be positive"
         except ValueError:
             pytest.fail(f"MAX_ITERATIONS should be a number, got: {max_iter}")
+
+
+class TestASPSystemConfig:
+    """Test the system configuration model."""
+
+    def test_config_is_frozen(self):
+        """Test shared configs cannot be changed after creation."""
+        config = ASPSystemConfig()
+
+        with pytest.raises(ValidationError):
+            config.model_name = "other"
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [(True, True), ("FALSE", False), ("true", True), ("High", "high")],
+    )
+    def test_reasoning_is_normalized(self, value, expected):
+        """Test reasoning strings are normalized to bools or levels."""
+        assert ASPSystemConfig(reasoning=value).reasoning == expected
+
+    @pytest.mark.parametrize("value", ["extreme", "none", 2, None])
+    def test_invalid_reasoning_is_rejected(self, value):
+        """Test unknown reasoning values fail validation."""
+        with pytest.raises(ValidationError):
+            ASPSystemConfig(reasoning=value)
+
+    @pytest.mark.parametrize("value", ["0", "many"])
+    def test_invalid_mcp_max_inflight_is_rejected(self, monkeypatch, value):
+        """Test tool concurrency must be a positive integer."""
+        monkeypatch.setenv("MCP_SOLVER_COMMAND", "uv")
+        monkeypatch.setenv("MCP_SOLVER_ARGS", "run,mcp-solver-asp")
+        monkeypatch.setenv("MCP_MAX_INFLIGHT", value)
+
+        with pytest.raises(ValueError):
+            ASPSystemConfig.from_env()
+
+
+class TestMCPServerConfig:
+    """Test the MCP server configuration model."""
+
+    def test_args_parse_to_tuple(self):
+        """Test comma-separated args are split into a tuple."""
+        server = MCPServerConfig(command="uv", args="--directory, /srv,run")
+
+        assert server.args == ("--directory", "/srv", "run")
+
+    def test_equal_configs_share_hash(self):
+        """Test configs can key caches."""
+        first = MCPServerConfig(command="uv", args=["run", "mcp-solver-asp"])
+        second = MCPServerConfig(command="uv", args="run,mcp-solver-asp")
+
+        assert {first: 1}[second] == 1
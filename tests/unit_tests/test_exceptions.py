@@ -0,0 +1,32 @@
+"""Exception classification tests."""
+
+from almasp.exceptions import AuthError, ConnectionError, classify_exception
+
+
+def chain(depth: int) -> Exception:
+    error = ValueError("root: 401 unauthorized")
+    for i in range(depth):
+        wrapper = RuntimeError(f"wrapper {i}")
+        wrapper.__cause__ = error
+        error = wrapper
+    return error
+
+
+class TestClassifyException:
+    """Test classification of generic exceptions."""
+
+    def test_uses_root_cause_of_deep_chain(self):
+        assert isinstance(classify_exception(chain(5000)), AuthError)
+
+    def test_uses_first_exception_of_group(self):
+        group = ExceptionGroup("task group", [OSError("connection refused")])
+
+        assert isinstance(classify_exception(group), ConnectionError)
+
+    def test_cyclic_chain_terminates(self):
+        first = RuntimeError("first")
+        second = RuntimeError("second")
+        first.__cause__ = second
+        second.__cause__ = first
+
+        assert classify_exception(first).code == "UNKNOWN"
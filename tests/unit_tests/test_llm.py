@@ -0,0 +1,55 @@
+"""LLM construction tests."""
+
+import asyncio
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+
+from almasp.config import ASPSystemConfig
+from almasp.llm import _ReplayMarkingCache, build_llm
+from almasp.workflow import _extract_usage
+
+
+class TestBuildLLM:
+    """Test chat model construction from the system config."""
+
+    def test_openrouter_uses_configured_model(self):
+        config = ASPSystemConfig(
+            provider="openrouter",
+            model_name="openai/gpt-oss-20b",
+            base_url="https://openrouter.ai/api/v1",
+            api_key="secret",
+        )
+
+        llm = build_llm(config)
+
+        assert llm.model_name == "openai/gpt-oss-20b"
+        assert llm.openai_api_key.get_secret_value() == "secret"
+
+    def test_ollama_uses_configured_model(self):
+        llm = build_llm(ASPSystemConfig(provider="ollama", model_name="gpt-oss:20b"))
+
+        assert llm.model == "gpt-oss:20b"
+
+    def test_llm_cache_is_opt_in(self):
+        assert build_llm(ASPSystemConfig()).cache is None
+        assert isinstance(
+            build_llm(ASPSystemConfig(llm_cache=True)).cache, _ReplayMarkingCache
+        )
+
+
+class TestLLMCache:
+    """Test usage accounting of cached LLM responses."""
+
+    def test_cache_hits_spend_no_tokens(self):
+        usage = {"input_tokens": 10, "output_tokens": 2, "total_tokens": 12}
+        responses = iter([AIMessage(content="a.", usage_metadata=usage)])
+        model = GenericFakeChatModel(messages=responses, cache=_ReplayMarkingCache())
+        prompt = [HumanMessage(content="Solve")]
+
+        fresh = asyncio.run(model.ainvoke(prompt))
+        replayed = asyncio.run(model.ainvoke(prompt))
+
+        assert _extract_usage(fresh) == (10, 2, 12)
+        assert replayed.content == "a."
+        assert _extract_usage(replayed) == (0, 0, 0)
@@ -1,11 +1,18 @@
 """MCP connection tests."""
 
 import os
+import sys
+import time
 
 import pytest
 from dotenv import load_dotenv
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
+from mcp.types import ListToolsResult, Tool
+
+from almasp.config import MCPServerConfig
+from almasp import mcp_client
+from almasp.mcp_client import _which, clear_tool_definition_cache, load_session_tools
 
 load_dotenv()
 
@@ -29,6 +36,19 @@ def mcp_server_params():
     return StdioServerParameters(command=command, args=args)
 
 
+class FakeSession:
+    """MCP session stub that counts tools/list requests."""
+
+    def __init__(self, tool_name="solve_model"):
+        self.tool_name = tool_name
+        self.list_calls = 0
+
+    async def list_tools(self, cursor=None):
+        self.list_calls += 1
+        tool = Tool(name=self.tool_name, inputSchema={"type": "object"})
+        return ListToolsResult(tools=[tool])
+
+
 class TestMCPConnection:
     """Test MCP server connection."""
 
@@ -108,6 +128,63 @@ class TestMCPToolsLoad:
                     assert hasattr(tool, "name"), "Tool should have a name"
                     assert tool.name, "Tool name should not be empty"
 
+    async def test_session_tools_list_each_server_once(self):
+        """Test tool definitions are listed once and rebound per session."""
+        clear_tool_definition_cache()
+        server = MCPServerConfig(command="fake-solver", args=("--cached",))
+        first, second = FakeSession(), FakeSession()
+
+        first_tools = await load_session_tools(first, server)
+        second_tools = await load_session_tools(second, server)
+
+        assert (first.list_calls, second.list_calls) == (1, 0)
+        assert [t.name for t in second_tools] == [t.name for t in first_tools]
+
+    async def test_session_tools_refresh_after_clear(self):
+        """Test clearing the cache makes the next session list tools again."""
+        clear_tool_definition_cache()
+        server = MCPServerConfig(command="fake-solver", args=("--cleared",))
+        await load_session_tools(FakeSession(), server)
+
+        clear_tool_definition_cache()
+        session = FakeSession(tool_name="get_model")
+        tools = await load_session_tools(session, server)
+
+        assert session.list_calls == 1
+        assert [t.name for t in tools] == ["get_model"]
+
+    async def test_session_tools_refresh_after_ttl(self, monkeypatch):
+        """Test expired tool definitions are listed again."""
+        clear_tool_definition_cache()
+        server = MCPServerConfig(command="fake-solver", args=("--expired",))
+        now = time.monotonic()
+        monkeypatch.setattr(mcp_client.time, "monotonic", lambda: now)
+        await load_session_tools(FakeSession(), server)
+
+        later = now + mcp_client.TOOL_DEFINITION_TTL + 1
+        monkeypatch.setattr(mcp_client.time, "monotonic", lambda: later)
+        session = FakeSession(tool_name="get_model")
+        tools = await load_session_tools(session, server)
+
+        assert session.list_calls == 1
+        assert [t.name for t in tools] == ["get_model"]
+
+
+class TestCommandLookup:
+    """Test resolution of the MCP solver command on PATH."""
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="needs POSIX executables")
+    def test_missing_command_is_found_once_installed(self, tmp_path):
+        path = str(tmp_path)
+
+        assert _which("fake-solver", path) is None
+
+        command = tmp_path / "fake-solver"
+        command.write_text("#!/bin/sh\n")
+        command.chmod(0o755)
+
+        assert _which("fake-solver", path) == str(command)
+
 
 class TestMCPServerInfo:
     """Test MCP server information."""
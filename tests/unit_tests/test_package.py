@@ -0,0 +1,46 @@
+"""Package entrypoint tests."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[2] / "src"
+
+
+def run(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env={"PYTHONPATH": str(SRC)},
+    )
+
+
+class TestLazyMain:
+    """Test the lazily imported main entrypoint."""
+
+    def test_light_import_skips_agent_stack(self):
+        result = run("import almasp, sys; assert 'almasp.main' not in sys.modules")
+
+        assert result.returncode == 0, result.stderr
+
+    def test_resolves_function_after_submodule_import(self):
+        result = run(
+            "import sys\n"
+            "import almasp.main\n"
+            "from almasp import main\n"
+            "assert main is sys.modules['almasp.main'].main\n"
+        )
+
+        assert result.returncode == 0, result.stderr
+
+    def test_resolves_function_before_submodule_import(self):
+        result = run(
+            "import sys\n"
+            "from almasp import main\n"
+            "import almasp.main\n"
+            "assert main is sys.modules['almasp.main'].main\n"
+            "assert almasp.main is main\n"
+        )
+
+        assert result.returncode == 0, result.stderr
@@ -0,0 +1,39 @@
+"""Prompt loading tests."""
+
+import os
+
+import pytest
+
+from almasp.exceptions import FileError
+from almasp.prompts import PromptManager, PromptTemplate
+
+
+class TestPromptTemplate:
+    """Test loading prompts from defaults and custom files."""
+
+    def test_returns_default_without_path(self):
+        assert PromptManager.get_solver_prompt() == PromptManager.SOLVER.default_content
+
+    def test_reloads_file_after_edit(self, tmp_path):
+        prompt_file = tmp_path / "solver.md"
+        prompt_file.write_text("first", encoding="utf-8")
+        template = PromptTemplate("solver", "default")
+
+        assert template.load(prompt_file) == "first"
+
+        prompt_file.write_text("second prompt", encoding="utf-8")
+        stat = prompt_file.stat()
+        os.utime(prompt_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert template.load(prompt_file) == "second prompt"
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(FileError, match="not found"):
+            PromptTemplate("solver", "default").load(tmp_path / "missing.md")
+
+    def test_empty_file_raises(self, tmp_path):
+        prompt_file = tmp_path / "empty.md"
+        prompt_file.write_text("  \n", encoding="utf-8")
+
+        with pytest.raises(FileError, match="Empty"):
+            PromptTemplate("solver", "default").load(prompt_file)
@@ -0,0 +1,54 @@
+"""Utility tests."""
+
+import asyncio
+from pathlib import Path
+
+from almasp.utils import (
+    current_problem,
+    export_solution,
+    get_logger,
+    load_solution,
+    reset_logger,
+    setup_logger,
+)
+
+
+class TestConcurrentLogging:
+    """Test per-problem log routing for concurrent batch runs."""
+
+    def test_records_reach_only_their_problem_log(self, tmp_path):
+        async def run(name: str) -> None:
+            problem = Path(name)
+            current_problem.set(problem)
+            setup_logger(problem, "INFO", export_path=tmp_path)
+            for i in range(3):
+                get_logger().info("%s line %d", name, i)
+                await asyncio.sleep(0)
+            reset_logger(problem)
+
+        async def main() -> None:
+            await asyncio.gather(run("a.md"), run("b.md"))
+
+        asyncio.run(main())
+
+        a_log = (tmp_path / "a.log").read_text()
+        b_log = (tmp_path / "b.log").read_text()
+        assert "a.md line 2" in a_log and "b.md" not in a_log
+        assert "b.md line 2" in b_log and "a.md" not in b_log
+        assert get_logger().handlers == []
+
+
+class TestExportSolution:
+    """Test solution export."""
+
+    def test_writes_json_and_lp(self, tmp_path):
+        results = {"success": True, "asp_code": "a."}
+
+        files = export_solution(Path("lpcp-2022/problem-1.md"), results, tmp_path)
+
+        assert load_solution(files["json"]) == results
+        assert files["lp"].read_text(encoding="utf-8") == "a."
+        assert sorted(p.name for p in files["json"].parent.iterdir()) == [
+            "problem-1.json",
+            "problem-1.lp",
+        ]
@@ -0,0 +1,280 @@
+"""Workflow tests."""
+
+import asyncio
+
+import pytest
+from langchain.agents import create_agent
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langchain_core.tools import tool
+from langgraph.graph import END, START, StateGraph
+from ollama import ResponseError
+
+from almasp.state import ASPState
+from almasp.workflow import (
+    call_agent,
+    create_solver_message,
+    should_continue,
+    solver_node,
+    validator_node,
+)
+
+
+class FakeToolModel(GenericFakeChatModel):
+    """Fake chat model that accepts tool binding."""
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+
+class FailingModel(FakeToolModel):
+    """Fake chat model that fails with a provider error."""
+
+    status_code: int = 404
+
+    def _generate(self, *args, **kwargs):
+        raise ResponseError("model 'missing' not found", self.status_code)
+
+
+@tool
+def solve_model() -> str:
+    """Solve the current model."""
+    return "Error: grounding failed"
+
+
+class TestCallAgent:
+    """Test agent invocation statistics."""
+
+    def test_collects_messages_and_usage(self):
+        responses = iter(
+            [
+                AIMessage(
+                    content="",
+                    tool_calls=[{"name": "solve_model", "args": {}, "id": "call-1"}],
+                    usage_metadata={
+                        "input_tokens": 10,
+                        "output_tokens": 2,
+                        "total_tokens": 12,
+                    },
+                ),
+                AIMessage(
+                    content="VALIDATION PASSED",
+                    response_metadata={
+                        "token_usage": {
+                            "prompt_tokens": 20,
+                            "completion_tokens": 3,
+                            "total_tokens": 23,
+                        }
+                    },
+                ),
+            ]
+        )
+        agent = create_agent(FakeToolModel(messages=responses), tools=[solve_model])
+
+        result = asyncio.run(call_agent([HumanMessage(content="Validate")], agent))
+
+        assert result["statistics"] == {
+            "input_tokens": 30,
+            "output_tokens": 5,
+            "total_tokens": 35,
+            "tool_calls": 1,
+        }
+        assert [type(m).__name__ for m in result["messages"]] == [
+            "AIMessage",
+            "ToolMessage",
+            "AIMessage",
+        ]
+
+    def test_reads_every_node_in_a_chunk(self):
+        class MultiNodeAgent:
+            async def astream(self, *args, **kwargs):
+                yield {
+                    "Middleware.before_model": None,
+                    "model": {"messages": [AIMessage(content="a.")]},
+                }
+
+        result = asyncio.run(
+            call_agent([HumanMessage(content="Solve")], MultiNodeAgent())
+        )
+
+        assert [m.content for m in result["messages"]] == ["a."]
+
+    def test_missing_model_raises_runtime_error(self):
+        agent = create_agent(FailingModel(messages=iter([])), tools=[solve_model])
+
+        with pytest.raises(RuntimeError, match="MODEL_NOT_FOUND"):
+            asyncio.run(call_agent([HumanMessage(content="Solve")], agent))
+
+    def test_other_provider_errors_propagate(self):
+        model = FailingModel(messages=iter([]), status_code=500)
+        agent = create_agent(model, tools=[solve_model])
+
+        with pytest.raises(ResponseError):
+            asyncio.run(call_agent([HumanMessage(content="Solve")], agent))
+
+
+def make_history(rounds):
+    history = []
+    for i in range(rounds):
+        call = {"name": "solve_model", "args": {}, "id": f"call-{i}"}
+        history += [
+            AIMessage(content="", tool_calls=[call]),
+            ToolMessage(content="ok", tool_call_id=f"call-{i}"),
+        ]
+    return history
+
+
+class TestCreateSolverMessage:
+    """Test solver message construction."""
+
+    def test_does_not_mutate_state_messages(self):
+        history = [AIMessage(content="a.")]
+        state = ASPState(messages=history, asp_code="a.", last_feedback="Wrong")
+
+        messages = create_solver_message(state, is_first_iteration=False)
+
+        assert len(state.messages) == 1
+        assert messages[1:-1] == state.messages
+        assert isinstance(messages[-1], HumanMessage)
+        assert "Wrong" in messages[-1].content
+
+    def test_caps_history_on_ai_boundary(self):
+        state = ASPState(messages=make_history(10), solver_history_max_messages=5)
+
+        messages = create_solver_message(state, is_first_iteration=False)
+
+        assert len(messages) <= 5 + 2
+        assert isinstance(messages[1], AIMessage)
+
+    def test_zero_cap_replays_full_history(self):
+        state = ASPState(messages=make_history(10), solver_history_max_messages=0)
+
+        messages = create_solver_message(state, is_first_iteration=False)
+
+        assert messages[1:-1] == state.messages
+
+    def test_feedback_iterations_share_problem_prefix(self):
+        state = ASPState(problem_description="Color the graph.")
+        first = create_solver_message(state, is_first_iteration=True)
+
+        state = ASPState(
+            problem_description="Color the graph.",
+            messages=[AIMessage(content="a.")],
+            last_feedback="Wrong",
+        )
+        later = create_solver_message(state, is_first_iteration=False)
+
+        assert later[0].content == first[0].content
+
+
+class TestUnchangedModelValidation:
+    """Test reuse of validator feedback when the solver edits nothing."""
+
+    def test_solver_without_edits_keeps_feedback(self):
+        call = {"name": "solve_model", "args": {}, "id": "call-1"}
+        responses = iter(
+            [AIMessage(content="", tool_calls=[call]), AIMessage(content="a.")]
+        )
+        agent = create_agent(FakeToolModel(messages=responses), tools=[solve_model])
+        state = ASPState(iteration_count=1, last_feedback="Missing constraint")
+
+        update = asyncio.run(solver_node(state, agent, frozenset({"add_item"})))
+
+        assert update["model_edited"] is False
+        assert update["last_feedback"] == "Missing constraint"
+
+    def test_assumes_edits_without_edit_tool_names(self):
+        call = {"name": "solve_model", "args": {}, "id": "call-1"}
+        responses = iter(
+            [AIMessage(content="", tool_calls=[call]), AIMessage(content="a.")]
+        )
+        agent = create_agent(FakeToolModel(messages=responses), tools=[solve_model])
+
+        update = asyncio.run(solver_node(ASPState(iteration_count=1), agent))
+
+        assert update["model_edited"] is True
+
+    def test_validator_rechecks_unchanged_model_once(self):
+        responses = iter([AIMessage(content="VALIDATION FAILED: still missing")])
+        agent = create_agent(FakeToolModel(messages=responses), tools=[solve_model])
+        state = ASPState(model_edited=False, last_feedback="Missing constraint")
+
+        update = asyncio.run(validator_node(state, agent))
+
+        assert update["last_feedback"] == "VALIDATION FAILED: still missing"
+        assert update["verdict_rechecked"] is True
+
+    def test_validator_reuses_rechecked_verdict(self):
+        class UnusedAgent:
+            async def astream(self, *args, **kwargs):
+                raise AssertionError("validator agent should not run")
+                yield
+
+        state = ASPState(
+            model_edited=False,
+            last_feedback="Missing constraint",
+            verdict_rechecked=True,
+        )
+
+        update = asyncio.run(validator_node(state, UnusedAgent()))
+
+        assert update == {"is_validated": False}
+
+
+class TestValidatorErrorSkip:
+    """Test the validator short-circuit after a solver error."""
+
+    def test_skips_agent_after_solver_error(self):
+        class UnusedAgent:
+            async def astream(self, *args, **kwargs):
+                raise AssertionError("validator agent should not run")
+                yield
+
+        state = ASPState(error_code="RUNTIME_ERROR")
+
+        update = asyncio.run(validator_node(state, UnusedAgent()))
+
+        assert update["is_validated"] is False
+        assert should_continue(state) == "end"
+
+
+class TestShouldContinue:
+    """Test routing after validation."""
+
+    def test_ends_when_validated(self):
+        assert should_continue(ASPState(is_validated=True)) == "end"
+
+    def test_ends_at_max_iterations(self):
+        state = ASPState(iteration_count=5, max_iterations=5)
+
+        assert should_continue(state) == "end"
+
+    def test_continues_otherwise(self):
+        state = ASPState(iteration_count=1, max_iterations=5)
+
+        assert should_continue(state) == "solver"
+
+
+class TestValidationHistory:
+    """Test validation history bookkeeping in the graph state."""
+
+    def test_keeps_only_latest_round(self):
+        graph = StateGraph(ASPState)
+        graph.add_node(
+            "validator",
+            lambda state: {
+                "validation_history": [
+                    AIMessage(content=f"round {state.iteration_count}")
+                ],
+                "iteration_count": state.iteration_count + 1,
+            },
+        )
+        graph.add_edge(START, "validator")
+        graph.add_conditional_edges(
+            "validator",
+            lambda state: END if state.iteration_count >= 3 else "validator",
+        )
+
+        final = graph.compile().invoke(ASPState())
+
+        assert [m.content for m in final["validation_history"]] == ["round 2"]